@@ -0,0 +1,41 @@
+"""store paper fingerprint as bytea
+
+Revision ID: 5f2c7a9d1e84
+Revises: 1b1da273bd86
+Create Date: 2026-10-18 10:12:41.503117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f2c7a9d1e84'
+down_revision: Union[str, Sequence[str], None] = '1b1da273bd86'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Hex digests -> raw bytes (existing ix_papers_fingerprint is rebuilt by the type change)
+    op.alter_column(
+        'papers', 'fingerprint',
+        existing_type=sa.String(),
+        type_=sa.LargeBinary(),
+        existing_nullable=True,
+        postgresql_using="decode(fingerprint, 'hex')",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'papers', 'fingerprint',
+        existing_type=sa.LargeBinary(),
+        type_=sa.String(),
+        existing_nullable=True,
+        postgresql_using="encode(fingerprint, 'hex')",
+    )
@@ -0,0 +1,43 @@
+"""add paper doi_norm
+
+Revision ID: 9d41e6b3c2a7
+Revises: 5f2c7a9d1e84
+Create Date: 2026-10-18 11:03:27.918264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d41e6b3c2a7'
+down_revision: Union[str, Sequence[str], None] = '5f2c7a9d1e84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('papers', sa.Column('doi_norm', sa.String(), nullable=True))
+    # Backfill; if existing rows differ only by case/whitespace, the oldest keeps the value
+    op.execute(
+        """
+        UPDATE papers p
+        SET doi_norm = lower(trim(p.doi))
+        WHERE p.doi IS NOT NULL
+          AND trim(p.doi) <> ''
+          AND p.id = (
+              SELECT min(q.id) FROM papers q
+              WHERE lower(trim(q.doi)) = lower(trim(p.doi))
+          )
+        """
+    )
+    op.create_index(op.f('ix_papers_doi_norm'), 'papers', ['doi_norm'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_papers_doi_norm'), table_name='papers')
+    op.drop_column('papers', 'doi_norm')
@@ -0,0 +1,43 @@
+"""unique search_queries (job_id, entities_hash)
+
+Revision ID: a4f6c8e20d17
+Revises: e7b2d94a1c60
+Create Date: 2026-10-18 17:35:09.614882
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4f6c8e20d17'
+down_revision: Union[str, Sequence[str], None] = 'e7b2d94a1c60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # If a job already has repeated entity hashes, the oldest row keeps the value
+    op.execute(
+        """
+        UPDATE search_queries s
+        SET entities_hash = NULL
+        WHERE s.entities_hash IS NOT NULL
+          AND s.id <> (
+              SELECT min(q.id) FROM search_queries q
+              WHERE q.job_id = s.job_id
+                AND q.entities_hash = s.entities_hash
+          )
+        """
+    )
+    op.create_index(
+        'uq_search_queries_job_id_entities_hash', 'search_queries',
+        ['job_id', 'entities_hash'], unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_search_queries_job_id_entities_hash', table_name='search_queries')
@@ -0,0 +1,37 @@
+"""add paper fingerprint band indexes
+
+Revision ID: b81d3f5c9e42
+Revises: a4f6c8e20d17
+Create Date: 2026-10-18 19:12:55.840163
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b81d3f5c9e42'
+down_revision: Union[str, Sequence[str], None] = 'a4f6c8e20d17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Mirrors FINGERPRINT_BAND_WIDTH / FINGERPRINT_INDEXED_BANDS in app.storage.models
+BAND_WIDTH = 2
+BAND_COUNT = 16
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for i in range(BAND_COUNT):
+        op.create_index(
+            f'ix_papers_fingerprint_band_{i}', 'papers',
+            [sa.text(f'substr(fingerprint, {i * BAND_WIDTH + 1}, {BAND_WIDTH})')]
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for i in range(BAND_COUNT):
+        op.drop_index(f'ix_papers_fingerprint_band_{i}', table_name='papers')
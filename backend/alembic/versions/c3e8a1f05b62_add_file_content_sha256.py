@@ -0,0 +1,30 @@
+"""add file content_sha256
+
+Revision ID: c3e8a1f05b62
+Revises: 9d41e6b3c2a7
+Create Date: 2026-10-18 14:22:41.530718
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3e8a1f05b62'
+down_revision: Union[str, Sequence[str], None] = '9d41e6b3c2a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('files', sa.Column('content_sha256', sa.String(length=64), nullable=True))
+    op.create_index(op.f('ix_files_content_sha256'), 'files', ['content_sha256'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_files_content_sha256'), table_name='files')
+    op.drop_column('files', 'content_sha256')
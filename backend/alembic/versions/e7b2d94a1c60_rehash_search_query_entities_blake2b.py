@@ -0,0 +1,61 @@
+"""rehash search_queries.entities_hash with blake2b
+
+Revision ID: e7b2d94a1c60
+Revises: c3e8a1f05b62
+Create Date: 2026-10-18 16:48:12.207354
+
+"""
+import hashlib
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b2d94a1c60'
+down_revision: Union[str, Sequence[str], None] = 'c3e8a1f05b62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _blake2b(entity_str: str) -> str:
+    return hashlib.blake2b(entity_str.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _sha256(entity_str: str) -> str:
+    return hashlib.sha256(entity_str.encode("utf-8")).hexdigest()[:16]
+
+
+def _rehash(hash_fn) -> None:
+    # Postgres has no built-in BLAKE2, so recompute from entities_used in Python
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text("SELECT id, entities_used FROM search_queries WHERE entities_used IS NOT NULL")
+    ).fetchall()
+
+    updates = []
+    for row_id, entities in rows:
+        if isinstance(entities, str):
+            entities = json.loads(entities)
+        if not entities:
+            continue
+        entity_str = "|".join(str(e).lower() for e in entities)
+        updates.append({"id": row_id, "entities_hash": hash_fn(entity_str)})
+
+    if updates:
+        bind.execute(
+            sa.text("UPDATE search_queries SET entities_hash = :entities_hash WHERE id = :id"),
+            updates
+        )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _rehash(_blake2b)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _rehash(_sha256)
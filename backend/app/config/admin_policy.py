@@ -96,6 +96,7 @@ class ExtractionConfig(BaseModel):
     enable_zonal_slicing: bool = True
     fallback_max_tokens: int = 1500  # Max tokens to extract if no whitelisted regions found (page-progressive)
     column_width_threshold: int = 200
+    process_workers: int = 2  # Processes parsing PDFs ahead of the ingest loop; 0 parses inline
 
 class RefineryConfig(BaseModel):
     """Configuration for LLM-based text cleaning."""
@@ -116,7 +117,7 @@ class SlicingConfig(BaseModel):
 
 class DeduplicationDefaults(BaseModel):
     """Deduplication and fingerprinting parameters."""
-    algorithm: str = "sha256"
+    algorithm: str = "sha256"  # md5 | sha256 | blake2b
     similarity_threshold: float = 0.95
     components: List[str] = ["title", "abstract"]
 
@@ -138,6 +139,8 @@ class DomainResolution(BaseModel):
     """Domain resolution parameters for LLM-based classification."""
     allowed_domains: List[str] = Field(default_factory=list)
     llm_order: List[str] = Field(default_factory=list)
+    batch_size: int = 16
+    """Hypotheses classified per LLM call by resolve_domains."""
 
 
 class IndirectPath(BaseModel):
@@ -170,6 +173,8 @@ class DownloaderConfig(BaseModel):
     """Configuration for strategic paper downloading."""
     batch_size: int = 1
     """Number of papers to download and ingest per cycle for 'Evenly Cooked' growth."""
+    max_concurrent_downloads: int = 4
+    """Max PDF downloads in flight at once within a batch (network-bound, so threads overlap waits)."""
 
 
 class PresentationConfig(BaseModel):
@@ -214,6 +219,8 @@ class CachingConfig(BaseModel):
     """Caching configuration."""
     redis: RedisConfig = Field(default_factory=RedisConfig)
     """Redis caching settings."""
+    embedding_memory_max_entries: int = 50000
+    """Max node embeddings kept in an EmbeddingCache's in-process LRU (older entries are evicted)."""
 
 
 class Algorithm(BaseModel):
@@ -235,6 +242,8 @@ class FetchParams(BaseModel):
     """Fetch provider parameters."""
     timeout_seconds: int = 30
     retry_attempts: int = 3
+    max_concurrent_fetches: int = 4
+    """Provider searches in flight at once per fetch stage (still paced by each provider's rate limit)."""
 
 
 class FetchProviderPolicy(BaseModel):
@@ -242,6 +251,10 @@ class FetchProviderPolicy(BaseModel):
     active: bool = True
     rate_limit_wait_seconds: float = 2.0
     """Wait time (seconds) between requests for rate limit compliance."""
+    rate_limit_burst: int = 1
+    """Requests allowed back-to-back after an idle period (shared across workers via Redis)."""
+    response_cache_ttl_seconds: int = 21600
+    """How long identical search responses are reused across jobs (0 disables)."""
 
 class FetchAPIPolicy(BaseModel):
     """Configuration for fetch providers and their domain-specific priority."""
@@ -263,6 +276,7 @@ class QueryOrchestrator(BaseModel):
 class PromptAssets(BaseModel):
     """System-level prompt template filenames."""
     domain_resolver: str = "domain_resolver.txt"
+    domain_resolver_batch: str = "domain_resolver_batch.txt"
     triple_extraction: str = "triple_extraction.txt"
     decision_llm: str = "decision_llm.txt"
     clarification_question: str = "clarification_question.txt"
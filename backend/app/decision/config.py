@@ -5,6 +5,8 @@ This config class provides a bridge for backward compatibility if needed.
 """
 import logging
 
+from app.config.admin_policy import admin_policy
+
 logger = logging.getLogger(__name__)
 
 
@@ -18,8 +20,6 @@ class DecisionConfig:
         Args:
             job_config: Deprecated, kept for backward compatibility.
         """
-        from app.config.admin_policy import admin_policy
-        
         # Read ALL thresholds from AdminPolicy
         dt = admin_policy.algorithm.decision_thresholds
         
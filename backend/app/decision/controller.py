@@ -4,6 +4,7 @@ Wires measurements, decision providers, and persistence together.
 This is the main entry point for Phase-5 orchestration.
 """
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from datetime import datetime
 
@@ -12,7 +13,7 @@ from sqlalchemy.orm import Session
 from app.storage.db import engine
 from app.storage.models import DecisionResult
 from app.decision.space import Decision
-from app.decision.measurements import compute_measurements
+from app.decision.measurements import compute_measurements, indirect_measurements_loader
 from app.decision.providers import DecisionProvider, RuleBasedDecisionProvider, LLMDecisionProvider
 
 logger = logging.getLogger(__name__)
@@ -110,18 +111,14 @@ class DecisionController:
             previous_decision_result.get("measurements") if previous_decision_result else None
         )
 
+        # Indirect path signals are only needed once the cheap rules have
+        # passed; providers pull them through the context loader below.
         measurements = compute_measurements(
             semantic_graph,
             hypotheses,
             job_metadata,
             previous_measurement_snapshot=previous_snapshot,
-        )
-
-        measurements = compute_measurements(
-            semantic_graph,
-            hypotheses,
-            job_metadata,
-            previous_measurement_snapshot=previous_snapshot,
+            defer_indirect=True,
         )
 
         logger.info(f"Computed measurements for job {job_id}: {len(measurements)} signals")
@@ -132,6 +129,9 @@ class DecisionController:
             "job_mode": job_mode,
             "semantic_graph": semantic_graph,
             "hypotheses": hypotheses,
+            "load_indirect_measurements": indirect_measurements_loader(
+                measurements, hypotheses, previous_snapshot
+            ),
         }
         
         decision = self.primary_provider.decide(measurements, context)
@@ -193,9 +193,19 @@ def get_decision_controller(provider_override: Optional[str] = None) -> Decision
         provider_override: If provided, overrides AdminPolicy setting.
     
     Returns:
-        An initialized DecisionController.
+        The shared DecisionController for the selected provider.
     """
     from app.config.admin_policy import admin_policy
     
     provider = provider_override or admin_policy.decision_provider
-    return DecisionController(provider_name=provider)
+    return _get_shared_controller(provider)
+
+
+@lru_cache(maxsize=None)
+def _get_shared_controller(provider_name: str) -> DecisionController:
+    """One controller (and provider set) per provider name per process.
+    
+    Controllers keep no per-job state, so the LLM provider's service handle and
+    prompt template are built once instead of on every decision task.
+    """
+    return DecisionController(provider_name=provider_name)
@@ -5,30 +5,21 @@ No further pipeline execution occurs for this verification job.
 """
 
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any
 from datetime import datetime
 
-from sqlalchemy.orm import Session
 
 from app.decision.handlers.base import Handler, HandlerResult
 from app.decision.handlers.registry import register_handler
-from app.storage.db import engine
-from app.storage.models import Job, VerificationResult, JobPaperEvidence, Paper, SearchQuery
+from app.storage.db import SessionLocal
+from app.storage.models import Job, VerificationResult, JobPaperEvidence, Paper
+from app.fetching.query_orchestrator import get_job_search_queries
 from presentation.events import push_presentation_event
 from app.path_reasoning.persistence import get_job_papers
 
 logger = logging.getLogger(__name__)
 
 
-def _get_search_queries(job_id: int, session: Session) -> List[Dict[str, Any]]:
-    """Return query texts used to search for this job."""
-    queries = session.query(SearchQuery).filter(SearchQuery.job_id == job_id).all()
-    return [
-        {"query_text": q.query_text, "status": q.status, "entities": q.entities_used}
-        for q in queries
-    ]
-
-
 @register_handler("verification_found")
 class VerificationFoundHandler(Handler):
     """Completes verification job with positive result."""
@@ -64,11 +55,15 @@ class VerificationFoundHandler(Handler):
             path = verification_result.get("path")  # List of nodes in the path
             explanation = verification_result.get("explanation", "")  # Human-readable explanation
             
+            # Single timestamp shared by the VR row, job result and output
+            now = datetime.utcnow()
+            now_iso = now.isoformat()
+
             # Store result in database
-            with Session(engine) as session:
+            with SessionLocal() as session:
                 # Collect papers fetched for this job (for conclusion)
                 fetched_papers = get_job_papers(job_id, session)
-                search_queries_used = _get_search_queries(job_id, session)
+                search_queries_used = get_job_search_queries(job_id, session)
                 
                 # Resolve evidence snippets for the verification path terminal output
                 from app.path_reasoning.persistence import resolve_triple_evidence_text
@@ -89,13 +84,13 @@ class VerificationFoundHandler(Handler):
                     path=path,
                     explanation=explanation,
                     supporting_papers=path_evidence,
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
+                    created_at=now,
+                    updated_at=now,
                 )
                 session.add(vr)
                 
                 # Update job status and result
-                job = session.query(Job).filter(Job.id == job_id).first()
+                job = session.get(Job, job_id)
                 if job:
                     job.status = "COMPLETED"
                     job.result = {
@@ -114,7 +109,7 @@ class VerificationFoundHandler(Handler):
                         "final_evidence": final_evidence,
                         # Queries used to search
                         "search_queries": search_queries_used,
-                        "completed_at": datetime.utcnow().isoformat(),
+                        "completed_at": now_iso,
                     }
                     session.commit()
                     logger.info(
@@ -161,7 +156,7 @@ class VerificationFoundHandler(Handler):
                 "fetched_papers": fetched_papers,
                 "fetched_papers_count": len(fetched_papers),
                 "search_queries": search_queries_used,
-                "completed_at": datetime.utcnow().isoformat(),
+                "completed_at": now_iso,
             }
             
             return HandlerResult(
@@ -5,28 +5,20 @@ after exhausting all search strategies. No further pipeline execution occurs.
 """
 
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any
 from datetime import datetime
 
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, literal, select, update
 
 from app.decision.handlers.base import Handler, HandlerResult
 from app.decision.handlers.registry import register_handler
-from app.storage.db import engine
-from app.storage.models import Job, VerificationResult, JobPaperEvidence, Paper, SearchQuery
-from app.path_reasoning.persistence import get_job_papers
-from presentation.events import push_presentation_event
+from app.storage.db import SessionLocal
+from app.storage.models import Job, VerificationResult
+from app.fetching.query_orchestrator import get_job_search_queries
 
 logger = logging.getLogger(__name__)
 
-
-def _get_search_queries(job_id: int, session: Session) -> List[Dict[str, Any]]:
-    """Return query texts used to search for this job."""
-    queries = session.query(SearchQuery).filter(SearchQuery.job_id == job_id).all()
-    return [
-        {"query_text": q.query_text, "status": q.status, "entities": q.entities_used}
-        for q in queries
-    ]
+_utcnow = datetime.utcnow
 
 
 @register_handler("verification_not_found")
@@ -46,6 +38,9 @@ class VerificationNotFoundHandler(Handler):
         - Stores verification result as not found in verification_results table
         - Updates job status to COMPLETED with full conclusion data
         - Returns result for UI
+        
+        All job_metadata validation happens before a session is opened, so a
+        malformed job never costs a connection-pool checkout.
         """
         try:
             # Get verification context from job_metadata
@@ -59,63 +54,90 @@ class VerificationNotFoundHandler(Handler):
                 )
             
             # Get verification result for explanation (if available)
-            verification_result = job_metadata.get("verification_result", {})
-            explanation = verification_result.get(
+            verification_result = job_metadata.get("verification_result")
+            if verification_result is not None and not isinstance(verification_result, dict):
+                return HandlerResult(
+                    status="error",
+                    message="Invalid verification_result in job_metadata",
+                )
+            explanation = (verification_result or {}).get(
                 "explanation",
                 "No connection found after exhausting all search strategies"
             )
             
-            # Store result in database
-            with Session(engine) as session:
+            # Single timestamp shared by the VR row, job result and output
+            now = _utcnow()
+            now_iso = now.isoformat()
+
+            # Imported here: this handler fires rarely, so keep them off worker startup
+            from app.path_reasoning.persistence import get_job_papers
+            from presentation.events import push_presentation_event
+
+            # Store result in database: one transaction, one round trip for both writes
+            with SessionLocal() as session, session.begin():
                 # Collect papers fetched for this job (for conclusion)
                 fetched_papers = get_job_papers(job_id, session)
-                search_queries_used = _get_search_queries(job_id, session)
+                search_queries_used = get_job_search_queries(job_id, session)
 
-                # Create verification result record
-                vr = VerificationResult(
-                    job_id=job_id,
-                    source=source,
-                    target=target,
-                    connection_found=False,
-                    connection_type=None,
-                    path=None,
-                    explanation=explanation,
-                    supporting_papers=None,
-                    created_at=datetime.utcnow(),
-                    updated_at=datetime.utcnow(),
+                # Update job status and result as a data-modifying CTE ...
+                updated_job = (
+                    update(Job)
+                    .where(Job.id == job_id)
+                    .values(
+                        status="COMPLETED",
+                        result={
+                            "verification_status": "not_found",
+                            "source": source,
+                            "target": target,
+                            "connection_type": None,
+                            "explanation": explanation,
+                            "reason": "No connection found after exhausting all search strategies",
+                            # All papers fetched during search — shows what was checked
+                            "fetched_papers": fetched_papers,
+                            "fetched_papers_count": len(fetched_papers),
+                            # Queries used to search
+                            "search_queries": search_queries_used,
+                            "completed_at": now_iso,
+                        },
+                    )
+                    .returning(Job.id)
+                    .cte("updated_job")
                 )
-                session.add(vr)
-                
-                # Update job status and result
-                job = session.query(Job).filter(Job.id == job_id).first()
-                if job:
-                    job.status = "COMPLETED"
-                    job.result = {
-                        "verification_status": "not_found",
-                        "source": source,
-                        "target": target,
-                        "connection_type": None,
-                        "explanation": explanation,
-                        "reason": "No connection found after exhausting all search strategies",
-                        # All papers fetched during search — shows what was checked
-                        "fetched_papers": fetched_papers,
-                        "fetched_papers_count": len(fetched_papers),
-                        # Queries used to search
-                        "search_queries": search_queries_used,
-                        "completed_at": datetime.utcnow().isoformat(),
-                    }
-                    session.commit()
-                    logger.info(
-                        f"Job {job_id} verification NOT FOUND: {source} -> {target}, "
-                        f"{len(fetched_papers)} papers checked, none established a connection"
+
+                # ... and insert the verification result from its RETURNING row.
+                # If the job does not exist the CTE yields no row, so nothing is
+                # inserted and RETURNING comes back empty.
+                vr_id = session.execute(
+                    insert(VerificationResult)
+                    .from_select(
+                        [
+                            "job_id", "source", "target", "connection_found",
+                            "explanation", "created_at", "updated_at",
+                        ],
+                        select(
+                            updated_job.c.id,
+                            literal(source),
+                            literal(target),
+                            literal(False),
+                            literal(explanation),
+                            literal(now),
+                            literal(now),
+                        ),
                     )
-                else:
-                    logger.info(f"Job {job_id} marked COMPLETED (Verification Not Found) by VerificationNotFoundHandler")
-                    session.rollback()
+                    .returning(VerificationResult.id)
+                ).scalar_one_or_none()
+
+                if vr_id is None:
+                    logger.warning(f"Job {job_id} not found for status update")
                     return HandlerResult(
                         status="error",
                         message=f"Job {job_id} not found",
                     )
+
+            logger.info(
+                f"Job {job_id} verification NOT FOUND: {source} -> {target}, "
+                f"{len(fetched_papers)} papers checked, none established a connection"
+            )
             
             # Emit presentation event
             # Note: The provided snippet uses 'source_query', 'target_query', 'final_evidence'
@@ -148,7 +170,7 @@ class VerificationNotFoundHandler(Handler):
                 "fetched_papers": fetched_papers,
                 "fetched_papers_count": len(fetched_papers),
                 "search_queries": search_queries_used,
-                "completed_at": datetime.utcnow().isoformat(),
+                "completed_at": now_iso,
             }
             
             return HandlerResult(
@@ -8,17 +8,23 @@ Note: compute_measurements is in app/decision/measurements.py (parent), not here
 This submodule provides indirect path-specific measurements and integration helpers.
 """
 
-from app.decision.indirect_path_measurements.indirect_paths import IndirectPathMeasurements
+from app.decision.indirect_path_measurements.indirect_paths import (
+    IndirectPathMeasurements,
+    IndirectPathComputeError,
+)
 from app.decision.indirect_path_measurements.config import IndirectPathConfig, get_indirect_path_config
 from app.decision.indirect_path_measurements.integration import (
     extend_measurements_with_indirect_paths,
     should_include_indirect_paths,
+    reload_indirect_path_config,
 )
 
 __all__ = [
     "IndirectPathMeasurements",
+    "IndirectPathComputeError",
     "IndirectPathConfig",
     "get_indirect_path_config",
     "extend_measurements_with_indirect_paths",
     "should_include_indirect_paths",
+    "reload_indirect_path_config",
 ]
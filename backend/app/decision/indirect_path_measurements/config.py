@@ -4,53 +4,78 @@ Loads from AdminPolicy (global admin layer).
 """
 
 import logging
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Any
 
+from app.config.admin_policy import admin_policy
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
 class IndirectPathConfig:
-    """Configuration for indirect path measurements."""
-    
-    def __init__(self, job_config: dict = None):
+    """Configuration for indirect path measurements.
+
+    Immutable value object: built once from AdminPolicy and shared
+    across jobs and threads.
+    """
+
+    MEASUREMENTS_ENABLED: bool = True
+    TEMPORAL_PLACEHOLDERS: bool = True
+    CONFIDENCE_NORM_FACTOR: float = 10.0
+    DOMINANCE_GAP_THRESHOLD: float = 0.2
+    MIN_PATH_LENGTH: int = 3
+    MAX_PATH_LENGTH: int = 4
+
+    @classmethod
+    def from_admin_policy(cls, policy=None) -> "IndirectPathConfig":
         """
-        Initialize config from AdminPolicy.
-        
+        Build config from AdminPolicy.
+
         Args:
-            job_config: Deprecated, kept for backward compatibility.
+            policy: AdminPolicy instance. Defaults to the global singleton.
         """
-        from app.config.admin_policy import admin_policy
-        
-        # Feature toggles from AdminPolicy
-        ip = admin_policy.algorithm.indirect_path
-        self.MEASUREMENTS_ENABLED = ip.enabled
-        self.TEMPORAL_PLACEHOLDERS = ip.temporal_placeholders
-        
-        # Parameters from AdminPolicy
-        dt = admin_policy.algorithm.decision_thresholds
-        ip = admin_policy.algorithm.indirect_path
-        
-        self.CONFIDENCE_NORM_FACTOR = float(dt.confidence_norm_factor)
-        self.DOMINANCE_GAP_THRESHOLD = float(ip.dominance_gap_threshold)
-        self.MIN_PATH_LENGTH = int(ip.min_length)
-        self.MAX_PATH_LENGTH = int(ip.max_length)
-        
+        if policy is None:
+            policy = admin_policy
+
+        # Read each policy section once
+        ip = policy.algorithm.indirect_path
+        dt = policy.algorithm.decision_thresholds
+
+        config = cls(
+            MEASUREMENTS_ENABLED=bool(ip.enabled),
+            TEMPORAL_PLACEHOLDERS=bool(ip.temporal_placeholders),
+            CONFIDENCE_NORM_FACTOR=float(dt.confidence_norm_factor),
+            DOMINANCE_GAP_THRESHOLD=float(ip.dominance_gap_threshold),
+            MIN_PATH_LENGTH=int(ip.min_length),
+            MAX_PATH_LENGTH=int(ip.max_length),
+        )
+
         logger.debug(
             f"IndirectPathConfig loaded from AdminPolicy: "
-            f"enabled={self.MEASUREMENTS_ENABLED}, "
-            f"temporal={self.TEMPORAL_PLACEHOLDERS}, "
-            f"norm_factor={self.CONFIDENCE_NORM_FACTOR}, "
-            f"gap_threshold={self.DOMINANCE_GAP_THRESHOLD}"
+            f"enabled={config.MEASUREMENTS_ENABLED}, "
+            f"temporal={config.TEMPORAL_PLACEHOLDERS}, "
+            f"norm_factor={config.CONFIDENCE_NORM_FACTOR}, "
+            f"gap_threshold={config.DOMINANCE_GAP_THRESHOLD}"
         )
+        return config
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Return config as a plain dict (e.g. for IndirectPathMeasurements.load_config)."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@lru_cache(maxsize=1)
+def _load_indirect_path_config() -> IndirectPathConfig:
+    return IndirectPathConfig.from_admin_policy()
 
-_config = None
 
 def get_indirect_path_config(job_config: dict = None) -> IndirectPathConfig:
     """
-    Get or create the global IndirectPathConfig instance.
+    Get the shared IndirectPathConfig instance.
+
+    Args:
+        job_config: Deprecated, kept for backward compatibility.
     """
-    global _config
-    if _config is None:
-        _config = IndirectPathConfig(job_config)
-    return _config
+    return _load_indirect_path_config()
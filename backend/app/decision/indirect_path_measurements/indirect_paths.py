@@ -25,6 +25,11 @@ from datetime import datetime
 logger = logging.getLogger(__name__)
 
 
+class IndirectPathComputeError(Exception):
+    """Raised when hypotheses are too malformed to compute indirect-path measurements."""
+    pass
+
+
 class IndirectPathMeasurements:
     """Computes indirect-path-based measurements from hypotheses."""
     
@@ -74,6 +79,9 @@ class IndirectPathMeasurements:
         
         Returns:
             Dict with all measurement keys (see module docstring).
+        
+        Raises:
+            IndirectPathComputeError: If hypotheses are malformed.
         """
         if not IndirectPathMeasurements.ENABLE_INDIRECT_PATH_MEASUREMENTS:
             logger.debug("Indirect path measurements disabled, returning empty dict")
@@ -83,6 +91,37 @@ class IndirectPathMeasurements:
             logger.debug("No hypotheses provided, returning zero measurements")
             return IndirectPathMeasurements._zero_measurements()
         
+        IndirectPathMeasurements._validate_hypotheses(hypotheses)
+        return IndirectPathMeasurements._compute_all(
+            hypotheses, base_measurements, previous_snapshot
+        )
+    
+    @staticmethod
+    def _validate_hypotheses(hypotheses: List[Dict[str, Any]]) -> None:
+        """Raise IndirectPathComputeError for hypotheses the measurements cannot use."""
+        for index, h in enumerate(hypotheses):
+            if not isinstance(h, dict):
+                raise IndirectPathComputeError(
+                    f"Hypothesis {index} is {type(h).__name__}, expected dict"
+                )
+            path = h.get("path")
+            if not isinstance(path, (list, tuple)) or not path:
+                raise IndirectPathComputeError(
+                    f"Hypothesis {index} has missing or empty path: {path!r}"
+                )
+            confidence = h.get("confidence", 0)
+            if isinstance(confidence, bool) or not isinstance(confidence, (int, float)):
+                raise IndirectPathComputeError(
+                    f"Hypothesis {index} has non-numeric confidence: {confidence!r}"
+                )
+    
+    @staticmethod
+    def _compute_all(
+        hypotheses: List[Dict[str, Any]],
+        base_measurements: Dict[str, Any],
+        previous_snapshot: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Compute every measurement for a non-empty hypotheses list."""
         measurements = {}
         
         # === Group by (source, target) pairs ===
@@ -279,6 +318,10 @@ class IndirectPathMeasurements:
             return 0.0
         
         pair_max_confs.sort(reverse=True)
+        if pair_max_confs[0] == 0:
+            raise IndirectPathComputeError(
+                "Confidence gap undefined: every pair has zero top confidence"
+            )
         gap = (pair_max_confs[0] - pair_max_confs[1]) / pair_max_confs[0]
         return gap
     
@@ -8,11 +8,22 @@ Does NOT modify decision logic—purely additive.
 import logging
 from typing import Dict, List, Any, Optional
 
-from app.decision.indirect_path_measurements.indirect_paths import IndirectPathMeasurements
-from app.decision.indirect_path_measurements.config import IndirectPathConfig
+from app.decision.indirect_path_measurements.indirect_paths import (
+    IndirectPathMeasurements,
+    IndirectPathComputeError,
+)
+from app.decision.indirect_path_measurements.config import (
+    IndirectPathConfig,
+    get_indirect_path_config,
+    _load_indirect_path_config,
+)
 
 logger = logging.getLogger(__name__)
 
+# Cached MEASUREMENTS_ENABLED flag; None until first access.
+# Invalidated by reload_indirect_path_config().
+_enabled_cache: Optional[bool] = None
+
 
 def extend_measurements_with_indirect_paths(
     base_measurements: Dict[str, Any],
@@ -30,6 +41,11 @@ def extend_measurements_with_indirect_paths(
         logger.debug("Indirect path measurements disabled, skipping extension")
         return base_measurements
     
+    if not hypotheses:
+        # Common in verification flows: nothing to compute, just zero-fill
+        base_measurements.update(IndirectPathMeasurements._zero_measurements())
+        return base_measurements
+    
     try:
         indirect_measurements = IndirectPathMeasurements.compute(
             hypotheses, base_measurements, previous_snapshot
@@ -39,6 +55,13 @@ def extend_measurements_with_indirect_paths(
             f"Extended measurements with {len(indirect_measurements)} "
             f"indirect-path metrics"
         )
+    except IndirectPathComputeError as e:
+        # Expected for degenerate hypotheses: skip the traceback unless debugging
+        logger.warning(
+            f"Skipping indirect path measurements: {e}",
+            exc_info=logger.isEnabledFor(logging.DEBUG),
+        )
+        # Fail gracefully: do not update measurements
     except Exception as e:
         logger.error(
             f"Failed to compute indirect path measurements: {e}",
@@ -51,5 +74,15 @@ def extend_measurements_with_indirect_paths(
 
 def should_include_indirect_paths() -> bool:
     """Check if indirect path measurements are enabled."""
-    config = get_indirect_path_config()
-    return config.MEASUREMENTS_ENABLED
+    global _enabled_cache
+    if _enabled_cache is None:
+        _enabled_cache = get_indirect_path_config().MEASUREMENTS_ENABLED
+    return _enabled_cache
+
+
+def reload_indirect_path_config() -> IndirectPathConfig:
+    """Drop cached config and enabled flag, then re-read AdminPolicy."""
+    global _enabled_cache
+    _load_indirect_path_config.cache_clear()
+    _enabled_cache = None
+    return get_indirect_path_config()
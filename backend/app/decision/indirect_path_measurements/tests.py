@@ -4,6 +4,7 @@ Run to verify measurements are computed correctly.
 """
 
 import logging
+from collections import defaultdict
 from typing import List, Dict, Any
 
 logger = logging.getLogger(__name__)
@@ -24,113 +25,112 @@ def validate_measurements(
         Dict of validation results: {check_name: status}
         status = "OK" | "WARN" | "FAIL"
     """
-    results = {}
+    # Read every measurement once up front
+    g = measurements.get
+    reported_total = g("total_hypothesis_count")
+    total, passed, ratio, red, conf, div, dens, var = (
+        g("total_hypothesis_count", 0), g("passed_hypothesis_count", 0),
+        g("pass_ratio", -1), g("redundancy_score", -1), g("max_normalized_confidence", -1),
+        g("diversity_score", -1), g("graph_density", -1), g("path_length_variance", -1),
+    )
+    max_paths_per_pair = g("max_paths_per_pair", 0)
+    growth = g("evidence_growth_rate")
+    stability = g("hypothesis_stability")
+    timestamp = g("time_since_last_update")
+    
+    # Every check defaults to FAIL; passing checks overwrite their slot
+    results = dict.fromkeys(
+        (
+            "count_match", "pass_count", "pass_ratio", "distinct_paths", "redundancy",
+            "normalized_confidence", "diversity", "density", "path_variance",
+            "temporal_placeholders",
+        ),
+        "FAIL",
+    )
+    ok_count = 0
     
     # Check 1: Counts match
-    if measurements.get("total_hypothesis_count") == len(hypotheses):
+    if reported_total == len(hypotheses):
         results["count_match"] = "OK"
+        ok_count += 1
     else:
-        results["count_match"] = "FAIL"
         logger.warning(
-            f"Total count mismatch: {measurements.get('total_hypothesis_count')} "
+            f"Total count mismatch: {reported_total} "
             f"!= {len(hypotheses)}"
         )
     
     # Check 2: Pass count <= total count
-    passed = measurements.get("passed_hypothesis_count", 0)
-    total = measurements.get("total_hypothesis_count", 0)
     if passed <= total:
         results["pass_count"] = "OK"
+        ok_count += 1
     else:
-        results["pass_count"] = "FAIL"
         logger.warning(f"Passed count {passed} > total {total}")
     
     # Check 3: Pass ratio in [0, 1]
-    ratio = measurements.get("pass_ratio", -1)
     if 0.0 <= ratio <= 1.0:
         results["pass_ratio"] = "OK"
+        ok_count += 1
     else:
-        results["pass_ratio"] = "FAIL"
         logger.warning(f"Pass ratio {ratio} out of bounds")
     
     # Check 4: Multiple same-source-target paths increase max_paths_per_pair
-    same_pair_hyps = [
-        h for h in hypotheses
-        if h.get("source") == h.get("source") and h.get("target") == h.get("target")
-    ]
-    # Find actual max_paths_per_pair by checking hypotheses
-    pair_groups = {}
+    # Find actual max_paths_per_pair by grouping distinct paths per pair
+    pair_groups = defaultdict(set)
     for h in hypotheses:
-        key = (h.get("source"), h.get("target"))
-        if key not in pair_groups:
-            pair_groups[key] = []
-        pair_groups[key].append(h)
+        if "path" in h:
+            pair_groups[(h.get("source"), h.get("target"))].add(tuple(h["path"]))
     
-    actual_max_paths = 0
-    for hyps in pair_groups.values():
-        distinct = len(set(tuple(h.get("path", [])) for h in hyps if "path" in h))
-        actual_max_paths = max(actual_max_paths, distinct)
+    actual_max_paths = max((len(paths) for paths in pair_groups.values()), default=0)
     
     if actual_max_paths > 1:
-        if measurements.get("max_paths_per_pair", 0) >= actual_max_paths:
+        if max_paths_per_pair >= actual_max_paths:
             results["distinct_paths"] = "OK"
+            ok_count += 1
         else:
             results["distinct_paths"] = "WARN"
             logger.warning(
-                f"max_paths_per_pair {measurements.get('max_paths_per_pair')} "
+                f"max_paths_per_pair {max_paths_per_pair} "
                 f"< actual {actual_max_paths}"
             )
     else:
         results["distinct_paths"] = "SKIP"
     
     # Check 5: Redundancy score in [0, 1]
-    red = measurements.get("redundancy_score", -1)
     if 0.0 <= red <= 1.0:
         results["redundancy"] = "OK"
+        ok_count += 1
     else:
-        results["redundancy"] = "FAIL"
         logger.warning(f"Redundancy score {red} out of bounds")
     
     # Check 6: Normalized confidence in [0, 1]
-    conf = measurements.get("max_normalized_confidence", -1)
     if 0.0 <= conf <= 1.0:
         results["normalized_confidence"] = "OK"
+        ok_count += 1
     else:
         results["normalized_confidence"] = "WARN"
     
     # Check 7: Diversity score in [0, 1]
-    div = measurements.get("diversity_score", -1)
     if 0.0 <= div <= 1.0:
         results["diversity"] = "OK"
-    else:
-        results["diversity"] = "FAIL"
+        ok_count += 1
     
     # Check 8: Graph density in [0, 1]
-    dens = measurements.get("graph_density", -1)
     if 0.0 <= dens <= 1.0:
         results["density"] = "OK"
-    else:
-        results["density"] = "FAIL"
+        ok_count += 1
     
     # Check 9: Path length variance >= 0
-    var = measurements.get("path_length_variance", -1)
     if var >= 0.0:
         results["path_variance"] = "OK"
-    else:
-        results["path_variance"] = "FAIL"
+        ok_count += 1
     
     # Check 10: Temporal placeholders are numeric or None
-    growth = measurements.get("evidence_growth_rate")
-    stability = measurements.get("hypothesis_stability")
-    timestamp = measurements.get("time_since_last_update")
     if (isinstance(growth, (int, float)) and 
         isinstance(stability, (int, float)) and 
         isinstance(timestamp, int)):
         results["temporal_placeholders"] = "OK"
-    else:
-        results["temporal_placeholders"] = "FAIL"
+        ok_count += 1
     
-    ok_count = sum(1 for v in results.values() if v == "OK")
     logger.info(
         f"Measurements validation: {ok_count}/{len(results)} checks passed"
     )
@@ -141,11 +141,10 @@ def validate_measurements(
 def example_usage():
     """Example: compute and validate measurements."""
     from app.decision.indirect_path_measurements.indirect_paths import IndirectPathMeasurements
-    from app.decision.indirect_path_measurements.config import IndirectPathConfig
+    from app.decision.indirect_path_measurements.config import get_indirect_path_config
     
     # Load config
-    IndirectPathConfig.load_from_env()
-    IndirectPathMeasurements.load_config(IndirectPathConfig.to_dict())
+    IndirectPathMeasurements.load_config(get_indirect_path_config().to_dict())
     
     # Sample hypotheses
     sample_hyps = [
@@ -10,14 +10,16 @@ and applies statistics only to passed hypotheses.
 Indirect path measurements are optionally extended via app/decision/indirect_path_measurements/
 submodule for additional structural metrics (paths_per_pair, redundancy_score, etc.).
 """
-from typing import Dict, List, Any, Optional
+from functools import cache
+from itertools import chain
+from typing import Callable, Dict, List, Any, Optional
 import logging
 
-from app.decision.config import DecisionConfig
-from app.decision.indirect_path_measurements.config import IndirectPathConfig
+from app.decision.config import get_decision_config
+from app.decision.indirect_path_measurements.config import get_indirect_path_config
 from app.decision.indirect_path_measurements.integration import extend_measurements_with_indirect_paths
-from app.storage.models import Job
 from app.storage.db import engine
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from app.path_reasoning.filtering.logic import is_low_confidence_rejection
 
@@ -29,16 +31,18 @@ def compute_measurements(
     hypotheses: List[Dict[str, Any]],
     job_metadata: Dict[str, Any],
     previous_measurement_snapshot: Optional[Dict[str, Any]] = None,
+    defer_indirect: bool = False,
 ) -> Dict[str, Any]:
     """
     Compute a dictionary of deterministic signals from artifacts.
+
+    With defer_indirect=True the indirect path extension is skipped; the
+    caller is expected to run it later via indirect_measurements_loader()
+    once a decision actually needs those signals.
     """
     measurements = {}
     
-    # Load Configuration from Job
     job_id = job_metadata.get("id")
-    decision_config = None
-    indirect_config = None
     
     # verification mode measurements can short-circuit and use job metadata
     job_mode = job_metadata.get("mode")
@@ -63,15 +67,19 @@ def compute_measurements(
             ]
             hierarchy_hashes = [compute_entities_hash(e) for e in hierarchy]
 
-            # Check status of all created hierarchy queries for this job
-            hierarchy_queries = session.query(SearchQuery).filter(
-                SearchQuery.job_id == job_id,
-                SearchQuery.entities_hash.in_(hierarchy_hashes)
-            ).all()
-
-            total_created = len(hierarchy_queries)
-            total_done = sum(1 for q in hierarchy_queries if q.status == "done")
-            any_new = any(q.status == "new" for q in hierarchy_queries)
+            # Tally statuses of all created hierarchy queries for this job in SQL:
+            # one aggregate row instead of hydrating every SearchQuery
+            total_created, total_done, new_count = session.execute(
+                select(
+                    func.count(),
+                    func.count().filter(SearchQuery.status == "done"),
+                    func.count().filter(SearchQuery.status == "new"),
+                ).where(
+                    SearchQuery.job_id == job_id,
+                    SearchQuery.entities_hash.in_(hierarchy_hashes),
+                )
+            ).one()
+            any_new = new_count > 0
             
             # UNIQUE check: how many distinct queries are actually possible in this hierarchy?
             # If source == target, unique_hierarchy_count will be less than 3.
@@ -92,83 +100,90 @@ def compute_measurements(
         # other measurements are irrelevant for verification; return early
         return measurements
 
-    if job_id:
-        with Session(engine) as session:
-            job = session.query(Job).filter(Job.id == job_id).first()
-            if job and job.job_config:
-                decision_config = DecisionConfig(job.job_config)
-                indirect_config = IndirectPathConfig(job.job_config)
-    
-    if not decision_config:
-        decision_config = DecisionConfig() # Defaults
-    if not indirect_config:
-        indirect_config = IndirectPathConfig() # Defaults
-
-    # ===== Split hypothesis populations =====
-    total_hypotheses = hypotheses  # all rows
-    passed_hypotheses = [h for h in hypotheses if h.get("passed_filter", False)]
-    rejected_hypotheses = [h for h in hypotheses if not h.get("passed_filter", False)]
-    promising_hypotheses = [h for h in hypotheses if is_low_confidence_rejection(h)]
+    # Thresholds come from AdminPolicy only (job_config is deprecated), so both
+    # configs are shared cached instances: no per-cycle job fetch or rebuild.
+    decision_config = get_decision_config()
+
+    # ===== Split hypothesis populations and gather passed-only statistics =====
+    # One pass over hypotheses: population counts, normalized confidences,
+    # source-target pairs and path nodes (statistics use passed hypotheses only).
+    norm_factor = decision_config.CONFIDENCE_NORMALIZATION_FACTOR
+    passed_count = 0
+    rejected_count = 0
+    promising_count = 0
+    sum_norm_conf = 0.0
+    first_conf = 0.0   # highest normalized confidence
+    second_conf = 0.0  # runner-up normalized confidence
+    pairs = set()
+    passed_paths = []
+    
+    for h in hypotheses:
+        if h.get("passed_filter", False):
+            passed_count += 1
+            
+            # Normalized confidence (0-1 range) from raw integer support count
+            norm_conf = min(h.get("confidence", 0) / norm_factor, 1.0)
+            sum_norm_conf += norm_conf
+            if norm_conf > first_conf:
+                second_conf = first_conf
+                first_conf = norm_conf
+            elif norm_conf > second_conf:
+                second_conf = norm_conf
+            
+            # Unique source-target pairs
+            pairs.add((h.get("source"), h.get("target")))
+            
+            # Path nodes for diversity (deduplicated after the loop)
+            passed_paths.append(h.get("path") or ())
+        else:
+            rejected_count += 1
+            if is_low_confidence_rejection(h):
+                promising_count += 1
+    
+    # Path node totals: one C-level pass each over all passed paths
+    all_nodes_in_paths = set(chain.from_iterable(passed_paths))
+    total_nodes = sum(map(len, passed_paths))
     
     # Population counts
-    measurements["total_hypothesis_count"] = len(total_hypotheses)
-    measurements["passed_hypothesis_count"] = len(passed_hypotheses)
-    measurements["rejected_hypothesis_count"] = len(rejected_hypotheses)
-    measurements["promising_hypothesis_count"] = len(promising_hypotheses)
+    total_count = len(hypotheses)
+    measurements["total_hypothesis_count"] = total_count
+    measurements["passed_hypothesis_count"] = passed_count
+    measurements["rejected_hypothesis_count"] = rejected_count
+    measurements["promising_hypothesis_count"] = promising_count
     
     # Filter ratio (diagnostic)
-    if measurements["total_hypothesis_count"] > 0:
-        measurements["filtered_to_total_ratio"] = (
-            measurements["passed_hypothesis_count"] / measurements["total_hypothesis_count"]
-        )
+    if total_count > 0:
+        measurements["filtered_to_total_ratio"] = passed_count / total_count
     else:
         measurements["filtered_to_total_ratio"] = 0.0
     
     
     # ===== Statistics computed ONLY from passed hypotheses =====
     
-    if passed_hypotheses:
-        # Raw confidence (integer support counts)
-        confidences = [h.get("confidence", 0) for h in passed_hypotheses]
-        # Normalized confidence (0-1 range)
-        normalized_confidences = [
-            min(c / decision_config.CONFIDENCE_NORMALIZATION_FACTOR, 1.0) for c in confidences
-        ]
-        measurements["max_normalized_confidence"] = max(normalized_confidences) if normalized_confidences else 0.0
-        measurements["mean_normalized_confidence"] = (
-            sum(normalized_confidences) / len(normalized_confidences) if normalized_confidences else 0.0
-        )
+    if passed_count:
+        measurements["max_normalized_confidence"] = first_conf
+        measurements["mean_normalized_confidence"] = sum_norm_conf / passed_count
         
         # Unique source-target pairs (from passed only)
-        pairs = set()
-        for h in passed_hypotheses:
-            pairs.add((h.get("source"), h.get("target")))
         measurements["unique_source_target_pairs"] = len(pairs)
         
         # Diversity: ratio of unique nodes in paths to total nodes involved (from passed only)
-        all_nodes_in_paths = set()
-        for h in passed_hypotheses:
-            path = h.get("path", [])
-            all_nodes_in_paths.update(path)
-        total_nodes = sum(len(h.get("path", [])) for h in passed_hypotheses)
         measurements["unique_nodes_in_paths"] = len(all_nodes_in_paths)
         if total_nodes > 0:
             measurements["diversity_score"] = len(all_nodes_in_paths) / total_nodes
         else:
             measurements["diversity_score"] = 0.0
         
-        # Dominant hypothesis: clear if first normalized_confidence >> second
+        # Dominant hypothesis: clear if top normalized_confidence >> runner-up
         # Uses normalized confidence for consistent probability-like semantics
-        if len(normalized_confidences) > 1:
-            first_conf = normalized_confidences[0]
-            second_conf = normalized_confidences[1]
+        if passed_count > 1:
             gap = first_conf - second_conf
             # "Clear dominant" if gap > (gap_ratio * first_confidence)
             measurements["is_dominant_clear"] = (
                 gap > decision_config.DOMINANT_GAP_RATIO * first_conf if first_conf > 0 else False
             )
         else:
-            measurements["is_dominant_clear"] = len(passed_hypotheses) > 0
+            measurements["is_dominant_clear"] = True
     else:
         # No passed hypotheses
         measurements["max_normalized_confidence"] = 0.0
@@ -179,16 +194,13 @@ def compute_measurements(
         measurements["is_dominant_clear"] = False
     
     # ===== Graph-level signals =====
-    semantic_nodes = semantic_graph.get("nodes", [])
-    semantic_edges = semantic_graph.get("edges", [])
-    node_count = len(semantic_nodes)
-    edge_count = len(semantic_edges)
-    
-    if node_count > 1:
-        max_edges = node_count * (node_count - 1)
-        measurements["graph_density"] = edge_count / max_edges if max_edges > 0 else 0.0
-    else:
-        measurements["graph_density"] = 0.0
+    node_count = len(semantic_graph.get("nodes", ()))
+    edge_count = len(semantic_graph.get("edges", ()))
+    
+    # Directed density; node_count > 1 guarantees a non-zero denominator
+    measurements["graph_density"] = (
+        edge_count / (node_count * (node_count - 1)) if node_count > 1 else 0.0
+    )
     
     measurements["semantic_graph_node_count"] = node_count
     measurements["semantic_graph_edge_count"] = edge_count
@@ -201,12 +213,13 @@ def compute_measurements(
     # ===== Extend with indirect path measurements (optional, configured via .env) =====
     # If INDIRECT_PATH_MEASUREMENTS_ENABLED=true, compute additional structural metrics
     # from hypotheses. These are read-only for now and do not influence decision logic.
-    measurements = extend_measurements_with_indirect_paths(
-        measurements,
-        hypotheses,
-        previous_snapshot=previous_measurement_snapshot,
-        config=indirect_config,
-    )
+    if not defer_indirect:
+        measurements = extend_measurements_with_indirect_paths(
+            measurements,
+            hypotheses,
+            previous_snapshot=previous_measurement_snapshot,
+            config=get_indirect_path_config(),
+        )
     
     # ===== Growth Score Calculation =====
     # score = Δ(unique_nodes) + Δ(diversity_ratio) + Δ(passed_count)
@@ -228,3 +241,27 @@ def compute_measurements(
         measurements["growth_score"] = 0.0
     
     return measurements
+
+
+def indirect_measurements_loader(
+    measurements: Dict[str, Any],
+    hypotheses: List[Dict[str, Any]],
+    previous_measurement_snapshot: Optional[Dict[str, Any]] = None,
+) -> Callable[[], Dict[str, Any]]:
+    """
+    Return a run-once callable that extends `measurements` in place with
+    indirect path signals.
+
+    Used together with compute_measurements(defer_indirect=True) so that
+    decisions settled by the cheap rules never pay for path analysis.
+    """
+    @cache
+    def load() -> Dict[str, Any]:
+        return extend_measurements_with_indirect_paths(
+            measurements,
+            hypotheses,
+            previous_snapshot=previous_measurement_snapshot,
+            config=get_indirect_path_config(),
+        )
+
+    return load
@@ -8,13 +8,17 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any
 import logging
 import os
+import re
+import string
 
-from app.decision.space import Decision, all_decisions
-from app.decision.config import DecisionConfig
+from app.config.admin_policy import admin_policy
+from app.decision.space import Decision, decision_from_string
+from app.decision.config import get_decision_config
 from app.llm import get_llm_service
 from app.prompts.loader import load_prompt
 from app.storage.db import engine
-from app.storage.models import Job
+from app.storage.models import DecisionResult
+from sqlalchemy import Float, func, select
 from sqlalchemy.orm import Session
 
 logger = logging.getLogger(__name__)
@@ -22,6 +26,29 @@ logger = logging.getLogger(__name__)
 # Fallback prompt for LLM decision-making
 DECISION_LLM_FALLBACK = "Decide: {decision_labels}"
 
+# Defaults for decision-prompt placeholders missing from the measurements
+_PROMPT_DEFAULTS = {
+    "total_hypothesis_count": 0,
+    "passed_hypothesis_count": 0,
+    "rejected_hypothesis_count": 0,
+    "max_normalized_confidence": 0.0,
+    "mean_normalized_confidence": 0.0,
+    "diversity_score": 0.0,
+    "graph_density": 0.0,
+    "is_dominant_clear": False,
+    "unique_source_target_pairs": 0,
+    "max_paths_per_pair": 0,
+    "evidence_growth_rate": 0.0,
+    "mean_path_length": 1.0,
+}
+
+
+class _PromptFields(dict):
+    """Measurements view for str.format_map; absent placeholders use _PROMPT_DEFAULTS."""
+    
+    def __missing__(self, key):
+        return _PROMPT_DEFAULTS[key]
+
 
 
 class DecisionProvider(ABC):
@@ -37,7 +64,7 @@ class RuleBasedDecisionProvider(DecisionProvider):
     Deterministic rule-based decision provider.
     
     Uses explicit if-else rules over measurements to select a decision.
-    All thresholds are loaded from DecisionConfig (per-job).
+    All thresholds are loaded from the shared DecisionConfig (AdminPolicy).
     """
     
     def __init__(self):
@@ -92,22 +119,8 @@ class RuleBasedDecisionProvider(DecisionProvider):
     
     def _decide_discovery(self, measurements: Dict[str, Any], context: Dict[str, Any]) -> Decision:
         """Original discovery mode decision logic."""
-        # Load config from job context
         job_id = context.get("job_id")
-        config = None
-        
-        if job_id:
-             with Session(engine) as session:
-                 from app.storage.models import Job
-                 job = session.query(Job).filter(Job.id == job_id).first()
-                 if job and job.job_config:
-                     from app.decision.config import DecisionConfig
-                     config = DecisionConfig(job.job_config)
         
-        if not config:
-            from app.decision.config import DecisionConfig
-            config = DecisionConfig()  # defaults
-            
         passed_count = measurements.get("passed_hypothesis_count", 0)
         promising_count = measurements.get("promising_hypothesis_count", 0)
         
@@ -115,6 +128,7 @@ class RuleBasedDecisionProvider(DecisionProvider):
         # Total count check (minimum threshold) is now secondary to "at least one" signal.
         # User: "no longer uses number of passed hypothesis as constraint for to be insufficiant_signal"
         # "that is insufficiant only even if no hypothesis that filterout by just confidence is less"
+        # Needs no config or DB access, so it runs before any session is opened.
         is_insufficient = (passed_count == 0 and promising_count == 0)
         
         if is_insufficient:
@@ -127,50 +141,72 @@ class RuleBasedDecisionProvider(DecisionProvider):
         # Extract measurements for decision logic
         growth_score = measurements.get("growth_score", 0.0)
         
+        # Thresholds come from AdminPolicy only (job_config is deprecated),
+        # so the shared config is used instead of re-reading the job row
+        config = get_decision_config()
+        min_abs_growth = config.MIN_ABSOLUTE_GROWTH_THRESHOLD
+        
         # Rule 2: Sliding Window Stagnancy Check (The "N Consecutive" Solution)
         # We check last N cycles. If ALL show minimal/zero growth, we halt.
-        if job_id:
+        # Check current growth vs threshold first: history only matters if stagnant now
+        is_stagnant_now = abs(growth_score) <= min_abs_growth
+        if job_id and is_stagnant_now:
             with Session(engine) as session:
-                from app.storage.models import DecisionResult
-                from sqlalchemy import desc
-                
-                # Fetch last N-1 records (N = config.STABILITY_CYCLE_THRESHOLD)
+                # Last N-1 records (N = config.STABILITY_CYCLE_THRESHOLD)
                 # We subtract 1 because the current cycle's growth is in 'growth_score'
                 window_size = config.STABILITY_CYCLE_THRESHOLD
                 n_minus_1 = max(0, window_size - 1)
                 
-                recent_results = session.query(DecisionResult).filter(
-                    DecisionResult.job_id == job_id
-                ).order_by(desc(DecisionResult.created_at)).limit(n_minus_1).all()
-                
-                growth_history = []
-                for res in recent_results:
-                    # Use a safety fallback for missing snapshots
-                    snap = res.measurements_snapshot or {}
-                    growth_history.append(float(snap.get("growth_score", 0.0)))
-                
-                # Check current growth vs threshold
-                is_stagnant_now = abs(growth_score) <= config.MIN_ABSOLUTE_GROWTH_THRESHOLD
-                
-                # Full window check: only if we have enough history to evaluate N cycles
-                if len(growth_history) == n_minus_1 and is_stagnant_now:
-                    all_stagnant = all(abs(g) <= config.MIN_ABSOLUTE_GROWTH_THRESHOLD for g in growth_history)
-                    if all_stagnant:
-                        logger.info(
-                            f"Saturation detected: last {window_size} cycles (inc. current) "
-                            f"show absolute growth <= {config.MIN_ABSOLUTE_GROWTH_THRESHOLD}. "
-                            f"History: {growth_history} + current: {growth_score:.3f}. "
-                            f"Returning HALT_NO_HYPOTHESIS"
-                        )
-                        return Decision.HALT_NO_HYPOTHESIS
+                # Missing snapshots / growth scores count as 0.0 growth
+                past_growth = func.coalesce(
+                    DecisionResult.measurements_snapshot["growth_score"].astext.cast(Float),
+                    0.0,
+                )
+                window = (
+                    select(past_growth.label("growth_score"))
+                    .where(DecisionResult.job_id == job_id)
+                    .order_by(DecisionResult.created_at.desc())
+                    .limit(n_minus_1)
+                    .subquery()
+                )
+                # The window size and its stagnant rows come back as one row
+                history_count, stagnant_count = session.execute(
+                    select(
+                        func.count(),
+                        func.count().filter(func.abs(window.c.growth_score) <= min_abs_growth),
+                    )
+                ).one()
+            
+            # Full window check: only if we have enough history to evaluate N cycles
+            if history_count == n_minus_1 and stagnant_count == n_minus_1:
+                logger.info(
+                    f"Saturation detected: last {window_size} cycles (inc. current) "
+                    f"show absolute growth <= {min_abs_growth}. "
+                    f"History: {stagnant_count}/{n_minus_1} stagnant + current: {growth_score:.3f}. "
+                    f"Returning HALT_NO_HYPOTHESIS"
+                )
+                return Decision.HALT_NO_HYPOTHESIS
 
         # Rule 3: Strategic Targeted Download (Prioritize growth over other halts)
-        if growth_score > config.MIN_ABSOLUTE_GROWTH_THRESHOLD:
+        if growth_score > min_abs_growth:
             logger.info(
-                f"Absolute growth detected (score={growth_score:.3f} > {config.MIN_ABSOLUTE_GROWTH_THRESHOLD}): "
+                f"Absolute growth detected (score={growth_score:.3f} > {min_abs_growth}): "
                 f"returning STRATEGIC_DOWNLOAD_TARGETED"
             )
             return Decision.STRATEGIC_DOWNLOAD_TARGETED
+
+        # Rules 4+ read indirect path signals; compute them only now
+        load_indirect = context.get("load_indirect_measurements")
+        if load_indirect:
+            load_indirect()
+        
+        # Thresholds used by Rules 4-6, read once
+        path_support = config.PATH_SUPPORT_THRESHOLD
+        high_confidence = config.HIGH_CONFIDENCE_THRESHOLD
+        sparse_density = config.SPARSE_GRAPH_DENSITY_THRESHOLD
+        diversity_ratio = config.DIVERSITY_RATIO_THRESHOLD
+        min_rel_growth = config.MIN_RELATIVE_GROWTH_THRESHOLD
+        low_diversity_pairs = config.LOW_DIVERSITY_UNIQUE_PAIRS_THRESHOLD
         
         max_norm_conf = measurements.get("max_normalized_confidence", 0.0)
         is_dominant = measurements.get("is_dominant_clear", False)
@@ -179,6 +215,7 @@ class RuleBasedDecisionProvider(DecisionProvider):
         graph_density = measurements.get("graph_density", 0.0)
         diversity_score = measurements.get("diversity_score", 0.0)
         evidence_growth_rate = measurements.get("evidence_growth_rate", 0.0)
+        unique_pairs = measurements.get("unique_source_target_pairs", 0)
         
         # Determine if we have indirect paths (no direct edge): path length > 1
         has_indirect_paths = mean_path_length > 1.0
@@ -186,13 +223,13 @@ class RuleBasedDecisionProvider(DecisionProvider):
         # Rule 4: HALT_CONFIDENT (strict conditions)
         # Only when: no direct edge, sufficient path support, clear dominance, high confidence
         if has_indirect_paths and \
-           max_paths_per_pair >= config.PATH_SUPPORT_THRESHOLD and \
+           max_paths_per_pair >= path_support and \
            is_dominant and \
-           max_norm_conf >= config.HIGH_CONFIDENCE_THRESHOLD:
+           max_norm_conf >= high_confidence:
             logger.info(
                 f"Halt confident: indirect paths={has_indirect_paths}, "
-                f"paths_per_pair={max_paths_per_pair} >= {config.PATH_SUPPORT_THRESHOLD}, "
-                f"dominant={is_dominant}, confidence={max_norm_conf:.2f} >= {config.HIGH_CONFIDENCE_THRESHOLD}: "
+                f"paths_per_pair={max_paths_per_pair} >= {path_support}, "
+                f"dominant={is_dominant}, confidence={max_norm_conf:.2f} >= {high_confidence}: "
                 f"returning HALT_CONFIDENT"
             )
             return Decision.HALT_CONFIDENT
@@ -200,20 +237,20 @@ class RuleBasedDecisionProvider(DecisionProvider):
         # Rule 5: HALT_NO_HYPOTHESIS (Single cycle stability check - backup to Rule 2)
         # When: no direct edge, weak path support, stable evidence_growth
         # Use graph density and diversity as stability indicators
-        is_stable = graph_density > config.SPARSE_GRAPH_DENSITY_THRESHOLD and \
-                    diversity_score > config.DIVERSITY_RATIO_THRESHOLD
+        is_stable = graph_density > sparse_density and \
+                    diversity_score > diversity_ratio
         
         # Rule 5 check: evidence_growth_rate is a relative ratio (%)
-        growth_is_minimal = abs(evidence_growth_rate) <= config.MIN_RELATIVE_GROWTH_THRESHOLD
+        growth_is_minimal = abs(evidence_growth_rate) <= min_rel_growth
         
         if has_indirect_paths and \
            growth_is_minimal and \
-           max_paths_per_pair < config.PATH_SUPPORT_THRESHOLD and \
+           max_paths_per_pair < path_support and \
            is_stable:
             logger.info(
                 f"Halt no hypothesis (Stability-based): indirect paths={has_indirect_paths}, "
-                f"relative growth_rate={evidence_growth_rate:.2f} <= {config.MIN_RELATIVE_GROWTH_THRESHOLD}, "
-                f"paths_per_pair={max_paths_per_pair} < {config.PATH_SUPPORT_THRESHOLD}, "
+                f"relative growth_rate={evidence_growth_rate:.2f} <= {min_rel_growth}, "
+                f"paths_per_pair={max_paths_per_pair} < {path_support}, "
                 f"stable=(density={graph_density:.4f}, diversity={diversity_score:.2f}): "
                 f"returning HALT_NO_HYPOTHESIS"
             )
@@ -221,10 +258,9 @@ class RuleBasedDecisionProvider(DecisionProvider):
         
         # Non-terminal decisions (proceed with normal flow)
         # Rule 6: Low diversity or sparse graph -> need more data
-        unique_pairs = measurements.get("unique_source_target_pairs", 0)
-        if unique_pairs < config.LOW_DIVERSITY_UNIQUE_PAIRS_THRESHOLD or \
-           diversity_score < config.DIVERSITY_RATIO_THRESHOLD or \
-           graph_density < config.SPARSE_GRAPH_DENSITY_THRESHOLD:
+        if unique_pairs < low_diversity_pairs or \
+           diversity_score < diversity_ratio or \
+           graph_density < sparse_density:
             logger.info(
                 f"Low diversity/sparse graph (unique_pairs={unique_pairs}, diversity_score={diversity_score:.2f}, "
                 f"density={graph_density:.4f}): returning FETCH_MORE_LITERATURE"
@@ -250,6 +286,16 @@ class LLMDecisionProvider(DecisionProvider):
     If the LLM returns invalid output, falls back to a safe default.
     """
     
+    # The decision space is fixed, so labels are built once at import time.
+    # A tuple (declaration order) keeps response parsing deterministic.
+    DECISION_LABELS = tuple(decision.value for decision in Decision)
+    DECISION_LABELS_STR = ", ".join(DECISION_LABELS)
+    # One alternation scans the response once; longest labels first so a
+    # label is never shadowed by a shorter one at the same position
+    DECISION_LABEL_RE = re.compile(
+        "|".join(map(re.escape, sorted(DECISION_LABELS, key=len, reverse=True)))
+    )
+    
     def __init__(self, llm_client=None):
         """
         Initialize LLM provider.
@@ -257,15 +303,23 @@ class LLMDecisionProvider(DecisionProvider):
         Args:
             llm_client: Deprecated. Ignored. Uses global LLM service instead.
         """
-        # Import here to avoid circular dependencies at module load
-        from app.llm import get_llm_service
         self.llm_service = get_llm_service()
         # Load prompt template using centralized loader
-        from app.config.admin_policy import admin_policy
         self.prompt_template = load_prompt(
             admin_policy.prompt_assets.decision_llm,
             fallback=DECISION_LLM_FALLBACK
         )
+        # decision_labels is constant: bind it once so decide() only fills measurements
+        self._bound_template = self.prompt_template.replace(
+            "{decision_labels}", self.DECISION_LABELS_STR
+        )
+        # Placeholders the template actually uses; only these are copied per call
+        try:
+            self._prompt_fields = frozenset(
+                name for _, name, _, _ in string.Formatter().parse(self._bound_template) if name
+            )
+        except ValueError:
+            self._prompt_fields = None  # Malformed template: formatting will fail and fall back
         logger.info("LLMDecisionProvider initialized (using global LLM service)")
     
     def decide(self, measurements: Dict[str, Any], context: Dict[str, Any]) -> Decision:
@@ -274,26 +328,21 @@ class LLMDecisionProvider(DecisionProvider):
         
         If LLM is unavailable or returns invalid output, return safe default.
         """
+        # The prompt exposes indirect path signals, so make sure they are present
+        load_indirect = context.get("load_indirect_measurements")
+        if load_indirect:
+            load_indirect()
+
         # Build prompt with measurements and decision space
-        decision_labels = ", ".join(all_decisions())
+        decision_labels = self.DECISION_LABELS_STR
         
         # Format the loaded template with actual values
         try:
-            prompt = self.prompt_template.format(
-                decision_labels=decision_labels,
-                total_hypothesis_count=measurements.get('total_hypothesis_count', 0),
-                passed_hypothesis_count=measurements.get('passed_hypothesis_count', 0),
-                rejected_hypothesis_count=measurements.get('rejected_hypothesis_count', 0),
-                max_normalized_confidence=measurements.get('max_normalized_confidence', 0.0),
-                mean_normalized_confidence=measurements.get('mean_normalized_confidence', 0.0),
-                diversity_score=measurements.get('diversity_score', 0.0),
-                graph_density=measurements.get('graph_density', 0.0),
-                is_dominant_clear=measurements.get('is_dominant_clear', False),
-                unique_source_target_pairs=measurements.get('unique_source_target_pairs', 0),
-                max_paths_per_pair=measurements.get('max_paths_per_pair', 0),
-                evidence_growth_rate=measurements.get('evidence_growth_rate', 0.0),
-                mean_path_length=measurements.get('mean_path_length', 1.0)
-            )
+            # Only placeholders present in the template are looked up
+            fields = measurements if self._prompt_fields is None else {
+                key: measurements[key] for key in self._prompt_fields if key in measurements
+            }
+            prompt = self._bound_template.format_map(_PromptFields(fields))
         except Exception as e:
             logger.error(f"Failed to format decision prompt: {e}")
             prompt = decision_labels  # Minimal fallback
@@ -307,11 +356,11 @@ class LLMDecisionProvider(DecisionProvider):
                 return Decision.INSUFFICIENT_SIGNAL
             
             # Try to parse the LLM response
-            for decision_label in all_decisions():
-                if decision_label in decision_text:
-                    logger.info(f"LLM decided: {decision_label}")
-                    from app.decision.space import decision_from_string
-                    return decision_from_string(decision_label)
+            match = self.DECISION_LABEL_RE.search(decision_text)
+            if match:
+                decision_label = match.group(0)
+                logger.info(f"LLM decided: {decision_label}")
+                return decision_from_string(decision_label)
             
             logger.warning(f"LLM returned unparsable response: {decision_text}; falling back to INSUFFICIENT_SIGNAL")
             return Decision.INSUFFICIENT_SIGNAL
@@ -5,7 +5,7 @@ All decision labels must be defined here; no hardcoded decisions elsewhere.
 Supports both discovery mode (hypothesis generation) and verification mode (entity connection verification).
 """
 from enum import Enum
-from typing import Set
+from typing import FrozenSet
 
 
 class Decision(Enum):
@@ -37,6 +37,24 @@ class Decision(Enum):
     VERIFICATION_NOT_FOUND = "verification_not_found"
 
 
+# Label lookups are built once: the decision space is fixed at import time
+_LABEL_TO_DECISION = {decision.value: decision for decision in Decision}
+_ALL_LABELS = frozenset(_LABEL_TO_DECISION)
+
+_DISCOVERY_DECISIONS = frozenset({
+    Decision.INSUFFICIENT_SIGNAL,
+    Decision.HALT_CONFIDENT,
+    Decision.HALT_NO_HYPOTHESIS,
+    Decision.FETCH_MORE_LITERATURE,
+    Decision.STRATEGIC_DOWNLOAD_TARGETED
+})
+
+_VERIFICATION_DECISIONS = frozenset({
+    Decision.VERIFICATION_FOUND,
+    Decision.VERIFICATION_NOT_FOUND
+})
+
+
 def decision_from_string(decision_str: str) -> Decision:
     """Convert a string to a Decision enum value.
     
@@ -51,38 +69,26 @@ def decision_from_string(decision_str: str) -> Decision:
     """
     decision_str = decision_str.strip().lower()
     
-    for decision in Decision:
-        if decision.value == decision_str:
-            return decision
-    
-    raise ValueError(f"Unknown decision: {decision_str}")
+    try:
+        return _LABEL_TO_DECISION[decision_str]
+    except KeyError:
+        raise ValueError(f"Unknown decision: {decision_str}") from None
 
 
-def all_decisions() -> Set[str]:
+def all_decisions() -> FrozenSet[str]:
     """Get all valid decision labels as strings.
     
     Returns:
-        Set of all decision label strings
+        Frozen set of all decision label strings (shared, not rebuilt per call)
     """
-    return {decision.value for decision in Decision}
+    return _ALL_LABELS
 
 
 def is_discovery_mode_decision(decision: Decision) -> bool:
     """Check if a decision is for discovery mode."""
-    discovery_decisions = {
-        Decision.INSUFFICIENT_SIGNAL,
-        Decision.HALT_CONFIDENT,
-        Decision.HALT_NO_HYPOTHESIS,
-        Decision.FETCH_MORE_LITERATURE,
-        Decision.STRATEGIC_DOWNLOAD_TARGETED
-    }
-    return decision in discovery_decisions
+    return decision in _DISCOVERY_DECISIONS
 
 
 def is_verification_mode_decision(decision: Decision) -> bool:
     """Check if a decision is for verification mode."""
-    verification_decisions = {
-        Decision.VERIFICATION_FOUND,
-        Decision.VERIFICATION_NOT_FOUND
-    }
-    return decision in verification_decisions
\ No newline at end of file
+    return decision in _VERIFICATION_DECISIONS
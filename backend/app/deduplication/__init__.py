@@ -7,6 +7,7 @@ Never depends on fetching, signals, or learning logic.
 """
 from app.deduplication.fingerprinting import (
     FingerprintConfig,
+    get_fingerprint_config,
     normalize_text,
     compute_fingerprint,
     hamming_distance,
@@ -20,10 +21,12 @@ from app.deduplication.detector import (
     check_fingerprint_duplicate,
     check_duplicate,
     persist_paper,
+    persist_papers,
 )
 
 __all__ = [
     "FingerprintConfig",
+    "get_fingerprint_config",
     "normalize_text",
     "compute_fingerprint",
     "hamming_distance",
@@ -35,4 +38,5 @@ __all__ = [
     "check_fingerprint_duplicate",
     "check_duplicate",
     "persist_paper",
+    "persist_papers",
 ]
@@ -5,13 +5,16 @@ Reusable across fetched papers and user-uploaded documents.
 Rejected candidates are logged but never ingested.
 """
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from sqlalchemy import case, func, or_
 from sqlalchemy.orm import Session
 
 from app.deduplication.fingerprinting import (
-    compute_fingerprint, fingerprints_match, FingerprintConfig
+    compute_fingerprint, fingerprints_match, FingerprintConfig, get_fingerprint_config
+)
+from app.storage.models import (
+    FINGERPRINT_BAND_WIDTH, FINGERPRINT_INDEXED_BANDS, Paper, fingerprint_band
 )
-from app.storage.models import Paper
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +37,128 @@ class DuplicateDetectionResult:
         self.reason = reason  # Human-readable explanation
 
 
+def _normalize_doi(doi: Optional[str]) -> Optional[str]:
+    """Canonical DOI form stored in Paper.doi_norm (lowercased, trimmed)."""
+    if not doi:
+        return None
+    return doi.strip().lower() or None
+
+
+def _doi_filter(candidate: Dict[str, Any]):
+    """Return (normalized DOI, SQL filter) for the candidate, or None if it has no DOI."""
+    doi = _normalize_doi(candidate.get("doi"))
+    if not doi:
+        return None
+    
+    # Exact match on the normalized, uniquely indexed column (no ILIKE scan)
+    return doi, Paper.doi_norm == doi
+
+
+def _external_id_filters(candidate: Dict[str, Any]) -> List[Tuple[str, str, Any]]:
+    """Return (id_type, normalized id_value, SQL filter) per candidate external id, in order."""
+    external_ids = candidate.get("external_ids")
+    if not external_ids or not isinstance(external_ids, dict):
+        return []
+    
+    filters = []
+    for id_type, id_value in external_ids.items():
+        if not id_value:
+            continue
+        
+        id_value = str(id_value).strip().lower()
+        # Match inside the JSON column in SQL (case-insensitive, numbers compared as text)
+        filters.append((
+            id_type,
+            id_value,
+            func.lower(Paper.external_ids[id_type].as_string()) == id_value,
+        ))
+    return filters
+
+
+def _fingerprint_band_count(digest: bytes, config: FingerprintConfig) -> Optional[int]:
+    """
+    Number of indexed fingerprint bands to shortlist on, or None if they cannot be trusted.
+    
+    fingerprints_match tolerates at most `max_diff` differing bits, and each
+    differing bit lies in a single band. Any max_diff + 1 disjoint bands
+    therefore guarantee (pigeonhole) that a match shares at least one band
+    verbatim. Returns None when the digest has fewer indexed bands than that.
+    """
+    bits = len(digest) * 8
+    max_diff = int((1.0 - config.similarity_threshold) * bits + 1e-9)
+    band_count = min(len(digest) // FINGERPRINT_BAND_WIDTH, FINGERPRINT_INDEXED_BANDS)
+    if band_count < max_diff + 1:
+        return None
+    return band_count
+
+
+def _fingerprint_filter(candidate_fp: str, config: FingerprintConfig):
+    """SQL shortlist of stored fingerprints that can match: rows sharing at least one band."""
+    # Fingerprints are stored as raw digests (see persist_paper)
+    digest = bytes.fromhex(candidate_fp)
+    band_count = _fingerprint_band_count(digest, config)
+    if band_count is None:
+        return Paper.fingerprint.isnot(None)
+    
+    # Each comparison renders the expression of ix_papers_fingerprint_band_<i>,
+    # so Postgres answers the OR with a bitmap scan over the band indexes
+    return or_(*(
+        fingerprint_band(Paper.fingerprint, i)
+        == digest[i * FINGERPRINT_BAND_WIDTH:(i + 1) * FINGERPRINT_BAND_WIDTH]
+        for i in range(band_count)
+    ))
+
+
+def _doi_match(paper_id: int, doi: str) -> DuplicateDetectionResult:
+    logger.info(f"Found duplicate by DOI: {doi} (paper_id={paper_id})")
+    return DuplicateDetectionResult(
+        is_duplicate=True,
+        match_type="doi",
+        matched_paper_id=paper_id,
+        confidence=1.0,
+        reason=f"DOI match: {doi}"
+    )
+
+
+def _external_id_match(paper_id: int, id_type: str, id_value: str) -> DuplicateDetectionResult:
+    logger.info(
+        f"Found duplicate by external ID: {id_type}={id_value} (paper_id={paper_id})"
+    )
+    return DuplicateDetectionResult(
+        is_duplicate=True,
+        match_type="external_id",
+        matched_paper_id=paper_id,
+        confidence=0.95,
+        reason=f"External ID match: {id_type}={id_value}"
+    )
+
+
+def _fingerprint_match(
+    paper_id: int,
+    paper_digest: Optional[bytes],
+    candidate_fp: str,
+    config: FingerprintConfig
+) -> Optional[DuplicateDetectionResult]:
+    if paper_digest is None:
+        return None
+    
+    paper_fp = paper_digest.hex()
+    if not fingerprints_match(candidate_fp, paper_fp, config):
+        return None
+    
+    logger.info(
+        f"Found duplicate by fingerprint: {candidate_fp} ≈ {paper_fp} "
+        f"(paper_id={paper_id})"
+    )
+    return DuplicateDetectionResult(
+        is_duplicate=True,
+        match_type="fingerprint",
+        matched_paper_id=paper_id,
+        confidence=0.90,
+        reason=f"Content fingerprint match"
+    )
+
+
 def check_doi_duplicate(
     candidate: Dict[str, Any],
     session: Session
@@ -48,24 +173,15 @@ def check_doi_duplicate(
     Returns:
         DuplicateDetectionResult if match found, None otherwise
     """
-    doi = candidate.get("doi")
-    if not doi:
+    doi_filter = _doi_filter(candidate)
+    if doi_filter is None:
         return None
     
-    doi = doi.strip().lower()
-    existing = session.query(Paper).filter(
-        Paper.doi.ilike(doi)
-    ).first()
-    
-    if existing:
-        logger.info(f"Found duplicate by DOI: {doi} (paper_id={existing.id})")
-        return DuplicateDetectionResult(
-            is_duplicate=True,
-            match_type="doi",
-            matched_paper_id=existing.id,
-            confidence=1.0,
-            reason=f"DOI match: {doi}"
-        )
+    doi, clause = doi_filter
+    matched_paper_id = session.query(Paper.id).filter(clause).limit(1).scalar()
+    
+    if matched_paper_id is not None:
+        return _doi_match(matched_paper_id, doi)
     
     return None
 
@@ -84,39 +200,12 @@ def check_external_id_duplicate(
     Returns:
         DuplicateDetectionResult if match found, None otherwise
     """
-    external_ids = candidate.get("external_ids")
-    if not external_ids or not isinstance(external_ids, dict):
-        return None
-    
-    # Search for papers with matching external IDs
-    for id_type, id_value in external_ids.items():
-        if not id_value:
-            continue
+    # Search for papers with matching external IDs, in candidate order
+    for id_type, id_value, clause in _external_id_filters(candidate):
+        matched_paper_id = session.query(Paper.id).filter(clause).limit(1).scalar()
         
-        id_value = str(id_value).strip().lower()
-        
-        # Query papers where external_ids contains this id_type:id_value
-        existing_papers = session.query(Paper).all()  # Fetch all for JSON search
-        
-        for paper in existing_papers:
-            if not paper.external_ids:
-                continue
-            
-            paper_id_value = paper.external_ids.get(id_type, "")
-            if isinstance(paper_id_value, str):
-                paper_id_value = paper_id_value.lower()
-            
-            if str(paper_id_value) == id_value:
-                logger.info(
-                    f"Found duplicate by external ID: {id_type}={id_value} (paper_id={paper.id})"
-                )
-                return DuplicateDetectionResult(
-                    is_duplicate=True,
-                    match_type="external_id",
-                    matched_paper_id=paper.id,
-                    confidence=0.95,
-                    reason=f"External ID match: {id_type}={id_value}"
-                )
+        if matched_paper_id is not None:
+            return _external_id_match(matched_paper_id, id_type, id_value)
     
     return None
 
@@ -132,36 +221,27 @@ def check_fingerprint_duplicate(
     Args:
         candidate: Paper dict with 'title', 'abstract', 'authors'
         session: SQLAlchemy session
-        config: FingerprintConfig (created if None)
+        config: FingerprintConfig (shared default if None)
     
     Returns:
         DuplicateDetectionResult if match found, None otherwise
     """
     if config is None:
-        config = FingerprintConfig()
+        config = get_fingerprint_config()
     
     candidate_fp = compute_fingerprint(candidate, config)
     if not candidate_fp:
         return None
     
-    # Query existing papers and compare fingerprints
-    existing_papers = session.query(Paper).filter(
-        Paper.fingerprint.isnot(None)
-    ).all()
+    # Shortlist in SQL; the exact similarity check runs on the shortlist only
+    query = session.query(Paper.id, Paper.fingerprint).filter(
+        _fingerprint_filter(candidate_fp, config)
+    )
     
-    for paper in existing_papers:
-        if fingerprints_match(candidate_fp, paper.fingerprint, config):
-            logger.info(
-                f"Found duplicate by fingerprint: {candidate_fp} ≈ {paper.fingerprint} "
-                f"(paper_id={paper.id})"
-            )
-            return DuplicateDetectionResult(
-                is_duplicate=True,
-                match_type="fingerprint",
-                matched_paper_id=paper.id,
-                confidence=0.90,
-                reason=f"Content fingerprint match"
-            )
+    for paper_id, paper_digest in query.yield_per(256):
+        result = _fingerprint_match(paper_id, paper_digest, candidate_fp, config)
+        if result:
+            return result
     
     return None
 
@@ -180,28 +260,60 @@ def check_duplicate(
     3. Content fingerprints
     (Semantic similarity can be added as optional step 4)
     
+    All three steps share one query: every row that can satisfy any step is
+    fetched once, ranked by the first step it satisfies, and walked in rank
+    order. The result is the same as running the steps one after another.
+    
     Args:
         candidate: Paper dict
         session: SQLAlchemy session
-        config: FingerprintConfig (created if None)
+        config: FingerprintConfig (shared default if None)
     
     Returns:
         DuplicateDetectionResult with is_duplicate=True if match, False otherwise
     """
+    if config is None:
+        config = get_fingerprint_config()
+    
+    # Steps in hierarchy order (list index = rank): (SQL filter, match type, details)
+    steps = []
+    
     # Step 1: DOI
-    result = check_doi_duplicate(candidate, session)
-    if result:
-        return result
+    doi_filter = _doi_filter(candidate)
+    if doi_filter is not None:
+        doi, clause = doi_filter
+        steps.append((clause, "doi", doi))
     
     # Step 2: External IDs
-    result = check_external_id_duplicate(candidate, session)
-    if result:
-        return result
+    for id_type, id_value, clause in _external_id_filters(candidate):
+        steps.append((clause, "external_id", (id_type, id_value)))
     
     # Step 3: Fingerprint
-    result = check_fingerprint_duplicate(candidate, session, config)
-    if result:
-        return result
+    candidate_fp = compute_fingerprint(candidate, config)
+    if candidate_fp:
+        steps.append((_fingerprint_filter(candidate_fp, config), "fingerprint", candidate_fp))
+    
+    if steps:
+        rank = case(
+            *((clause, index) for index, (clause, _, _) in enumerate(steps)),
+            else_=len(steps),
+        ).label("rank")
+        query = (
+            session.query(Paper.id, Paper.fingerprint, rank)
+            .filter(or_(*(clause for clause, _, _ in steps)))
+            .order_by(rank)
+        )
+        
+        for paper_id, paper_digest, row_rank in query.yield_per(256):
+            _, match_type, details = steps[row_rank]
+            if match_type == "doi":
+                return _doi_match(paper_id, details)
+            if match_type == "external_id":
+                return _external_id_match(paper_id, *details)
+            # Fingerprint rows are only a shortlist: confirm similarity
+            result = _fingerprint_match(paper_id, paper_digest, details, config)
+            if result:
+                return result
     
     # No duplicate found
     logger.debug(f"No duplicate found for paper: {candidate.get('title', 'N/A')}")
@@ -223,34 +335,106 @@ def persist_paper(
     Args:
         candidate: Paper dict
         session: SQLAlchemy session
-        config: FingerprintConfig (created if None)
+        config: FingerprintConfig (shared default if None)
     
     Returns:
         Persisted Paper model instance
     """
     if config is None:
-        config = FingerprintConfig()
+        config = get_fingerprint_config()
     
     # Compute fingerprint
     fingerprint = compute_fingerprint(candidate, config)
+    paper = _new_paper(candidate, fingerprint)
+    
+    session.add(paper)
+    session.flush()  # Flush to get paper.id without committing
+    
+    logger.info(f"Persisted paper: {paper.title[:50]}... (id={paper.id})")
+    
+    return paper
+
+
+def persist_papers(
+    candidates: List[Dict[str, Any]],
+    session: Session,
+    config: Optional[FingerprintConfig] = None
+) -> List[Paper]:
+    """
+    Store several papers with a single flush (one multi-row INSERT).
+    
+    Assumes every candidate already passed check_duplicate against the
+    database. Candidates that duplicate an earlier one in the same batch
+    (same DOI -> external ID -> fingerprint hierarchy) are not inserted
+    again and map to the earlier paper.
+    
+    Args:
+        candidates: Paper dicts
+        session: SQLAlchemy session
+        config: FingerprintConfig (shared default if None)
+    
+    Returns:
+        One Paper per candidate, in input order
+    """
+    if config is None:
+        config = get_fingerprint_config()
+    
+    papers = []
+    new_papers = []
+    by_doi: Dict[str, Paper] = {}
+    by_external_id: Dict[Tuple[str, str], Paper] = {}
+    by_fingerprint: List[Tuple[str, Paper]] = []
     
-    # Extract fields
-    paper = Paper(
+    for candidate in candidates:
+        fingerprint = compute_fingerprint(candidate, config)
+        doi = _normalize_doi(candidate.get("doi"))
+        id_keys = [(id_type, id_value) for id_type, id_value, _ in _external_id_filters(candidate)]
+        
+        # Same hierarchy as check_duplicate, against papers earlier in this batch
+        paper = by_doi.get(doi) if doi else None
+        if paper is None:
+            paper = next((by_external_id[key] for key in id_keys if key in by_external_id), None)
+        if paper is None and fingerprint:
+            paper = next(
+                (p for fp, p in by_fingerprint if fingerprints_match(fingerprint, fp, config)),
+                None
+            )
+        
+        if paper is None:
+            paper = _new_paper(candidate, fingerprint)
+            new_papers.append(paper)
+            if doi:
+                by_doi[doi] = paper
+            for key in id_keys:
+                by_external_id.setdefault(key, paper)
+            if fingerprint:
+                by_fingerprint.append((fingerprint, paper))
+        
+        papers.append(paper)
+    
+    if new_papers:
+        session.add_all(new_papers)
+        session.flush()  # One round trip for all ids, without committing
+        logger.info(
+            f"Persisted {len(new_papers)} papers in one batch "
+            f"({len(candidates) - len(new_papers)} in-batch duplicates)"
+        )
+    
+    return papers
+
+
+def _new_paper(candidate: Dict[str, Any], fingerprint: str) -> Paper:
+    """Build (but do not add) a Paper row from a candidate dict."""
+    return Paper(
         title=candidate.get("title", ""),
         abstract=candidate.get("abstract"),
         authors=candidate.get("authors"),
         year=candidate.get("year"),
         venue=candidate.get("venue"),
         doi=candidate.get("doi"),
+        doi_norm=_normalize_doi(candidate.get("doi")),
         external_ids=candidate.get("external_ids"),
-        fingerprint=fingerprint,
+        fingerprint=bytes.fromhex(fingerprint),  # Raw digest: half the bytes of hex
         source=candidate.get("source", "unknown"),
         pdf_url=candidate.get("pdf_url")
     )
-    
-    session.add(paper)
-    session.flush()  # Flush to get paper.id without committing
-    
-    logger.info(f"Persisted paper: {paper.title[:50]}... (id={paper.id})")
-    
-    return paper
@@ -2,17 +2,23 @@
 Content-based fingerprinting for paper identification.
 
 Generates configurable hashes of paper content for deduplication and identification.
-Supports multiple algorithms (MD5, SHA256) and handles partial abstracts/titles.
+Supports multiple algorithms (MD5, SHA256, BLAKE2b) and handles partial abstracts/titles.
 
 Separated from fetching: reusable for both fetched and uploaded documents.
 """
 import hashlib
 import logging
 import os
-from typing import Optional, Dict, Any
+import re
+from functools import lru_cache
+from typing import Optional, Dict, Any, Iterator
 
 logger = logging.getLogger(__name__)
 
+# Anything that is neither alphanumeric nor whitespace (same split as
+# str.isalnum()/str.isspace(); \w also admits '_', so it is listed explicitly)
+_NON_ALNUM_SPACE_RE = re.compile(r"[^\w\s]|_")
+
 
 class FingerprintConfig:
     """Configuration for fingerprinting behavior."""
@@ -22,7 +28,7 @@ class FingerprintConfig:
         
         config = admin_policy.algorithm.deduplication_defaults
         
-        # Algorithm: 'md5', 'sha256'
+        # Algorithm: 'md5', 'sha256', 'blake2b' (128-bit digest)
         self.algorithm = config.algorithm.lower()
         
         # Threshold: minimum similarity score (0.0-1.0)
@@ -31,72 +37,80 @@ class FingerprintConfig:
         # Components to include in fingerprint
         self.components = config.components
         
-        logger.info(
+        logger.debug(
             f"FingerprintConfig: algorithm={self.algorithm}, "
             f"components={self.components}, threshold={self.similarity_threshold}"
         )
 
 
+@lru_cache(maxsize=1)
+def get_fingerprint_config() -> FingerprintConfig:
+    """Get the shared FingerprintConfig (AdminPolicy-backed, built once per process)."""
+    return FingerprintConfig()
+
+
 def normalize_text(text: Optional[str]) -> str:
     """Normalize text for fingerprinting: lowercase, strip whitespace, remove punctuation."""
     if not text:
         return ""
     
-    # Lowercase
-    text = text.lower()
-    # Strip leading/trailing whitespace
-    text = text.strip()
-    # Remove common punctuation (keep alphanumeric and spaces)
-    text = "".join(c if c.isalnum() or c.isspace() else "" for c in text)
-    # Collapse multiple spaces
+    # Lowercase, then remove punctuation (keep alphanumeric and spaces) in one C-level pass
+    text = _NON_ALNUM_SPACE_RE.sub("", text.lower())
+    # Collapse multiple spaces (also strips leading/trailing whitespace)
     text = " ".join(text.split())
     
     return text
 
 
-def compute_fingerprint(paper: Dict[str, Any], config: Optional[FingerprintConfig] = None) -> str:
-    """
-    Compute content-based fingerprint of a paper.
-    
-    Args:
-        paper: Dict with keys like 'title', 'abstract', 'authors'
-        config: FingerprintConfig instance (created if None)
-    
-    Returns:
-        Hex string fingerprint using configured algorithm
-    """
-    if config is None:
-        config = FingerprintConfig()
-    
-    # Extract and normalize components
-    components_text = []
-    
+def _iter_components(paper: Dict[str, Any], config: FingerprintConfig) -> Iterator[str]:
+    """Yield the normalized fingerprint components of a paper in a fixed order."""
     if "title" in config.components and paper.get("title"):
-        components_text.append(normalize_text(paper["title"]))
+        yield normalize_text(paper["title"])
     
     if "abstract" in config.components and paper.get("abstract"):
-        components_text.append(normalize_text(paper["abstract"]))
+        yield normalize_text(paper["abstract"])
     
     if "authors" in config.components and paper.get("authors"):
         # Normalize author list (concatenate normalized author names)
         authors = paper["authors"]
         if isinstance(authors, list):
-            author_names = " ".join(
+            yield " ".join(
                 normalize_text(a.get("name", "") if isinstance(a, dict) else str(a))
                 for a in authors
             )
-            components_text.append(author_names)
         elif isinstance(authors, str):
-            components_text.append(normalize_text(authors))
+            yield normalize_text(authors)
+
+
+def compute_fingerprint(paper: Dict[str, Any], config: Optional[FingerprintConfig] = None) -> str:
+    """
+    Compute content-based fingerprint of a paper.
     
-    # Combine normalized components
-    combined = " | ".join(components_text)
+    Args:
+        paper: Dict with keys like 'title', 'abstract', 'authors'
+        config: FingerprintConfig instance (shared default if None)
     
-    # Compute hash using configured algorithm
+    Returns:
+        Hex string fingerprint using configured algorithm
+    """
+    if config is None:
+        config = get_fingerprint_config()
+    
+    # Hash each normalized component as it is produced (joined by " | ")
+    # instead of building one concatenated string first
     if config.algorithm == "md5":
-        hash_obj = hashlib.md5(combined.encode("utf-8"))
+        hash_obj = hashlib.md5()
+    elif config.algorithm == "blake2b":
+        hash_obj = hashlib.blake2b(digest_size=16)
     else:  # Default to sha256
-        hash_obj = hashlib.sha256(combined.encode("utf-8"))
+        hash_obj = hashlib.sha256()
+    
+    first = True
+    for component in _iter_components(paper, config):
+        if not first:
+            hash_obj.update(b" | ")
+        hash_obj.update(component.encode("utf-8"))
+        first = False
     
     fingerprint = hash_obj.hexdigest()
     logger.debug(f"Computed fingerprint for paper '{paper.get('title', 'N/A')}': {fingerprint}")
@@ -110,30 +124,24 @@ def hamming_distance(fp1: str, fp2: str) -> int:
     Returns number of differing bits.
     """
     if len(fp1) != len(fp2):
-        return max(len(fp1), len(fp2))  # Max distance if different lengths
-    
-    distance = 0
-    for c1, c2 in zip(fp1, fp2):
-        if c1 != c2:
-            distance += 1
+        return max(len(fp1), len(fp2)) * 4  # Max distance (in bits) if different lengths
     
-    return distance
+    # XOR the fingerprints as integers and count set bits in one C-level call
+    return (int(fp1, 16) ^ int(fp2, 16)).bit_count()
 
 
 def fingerprint_similarity(fp1: str, fp2: str) -> float:
     """
     Compute similarity (0.0-1.0) between two fingerprints.
-    Uses Hamming distance normalized by fingerprint length.
+    Uses Hamming distance normalized by fingerprint length in bits.
     """
     if not fp1 or not fp2:
         return 0.0
     
-    max_len = max(len(fp1), len(fp2))
-    if max_len == 0:
-        return 1.0
+    max_bits = max(len(fp1), len(fp2)) * 4
     
     distance = hamming_distance(fp1, fp2)
-    similarity = 1.0 - (distance / (max_len * 4))  # Normalize to [0,1]
+    similarity = 1.0 - (distance / max_bits)  # Normalize to [0,1]
     
     return max(0.0, min(1.0, similarity))  # Clamp to [0,1]
 
@@ -144,13 +152,13 @@ def fingerprints_match(fp1: str, fp2: str, config: Optional[FingerprintConfig] =
     
     Args:
         fp1, fp2: Hex fingerprint strings
-        config: FingerprintConfig (created if None)
+        config: FingerprintConfig (shared default if None)
     
     Returns:
         True if similarity >= threshold, False otherwise
     """
     if config is None:
-        config = FingerprintConfig()
+        config = get_fingerprint_config()
     
     similarity = fingerprint_similarity(fp1, fp2)
     return similarity >= config.similarity_threshold
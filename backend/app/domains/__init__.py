@@ -1,12 +1,20 @@
 """Domains module: domain detection for provider selection."""
 from app.domains.resolver import (
     DomainResolverConfig,
+    batch_llm_domain_resolution,
+    cached_domain_resolution,
+    get_domain_resolver_config,
     llm_domain_resolution,
     resolve_domain,
+    resolve_domains,
 )
 
 __all__ = [
     "DomainResolverConfig",
+    "batch_llm_domain_resolution",
+    "cached_domain_resolution",
+    "get_domain_resolver_config",
     "llm_domain_resolution",
     "resolve_domain",
+    "resolve_domains",
 ]
@@ -7,14 +7,32 @@ This module implements the Domain Resolution Contract:
 - Fallback loop through admin_policy.llm_order
 - Stable, one-time assignment per hypothesis
 """
+import hashlib
+import json
 import logging
+from functools import lru_cache
 from typing import Dict, Any, Optional, List, Tuple
 
 from app.prompts.loader import load_prompt
+from app.storage.redis_client import get_redis_sync
 
 logger = logging.getLogger(__name__)
 
 
+_FALLBACK_TEMPLATE = (
+    "Classify the following hypothesis domain. Allowed domains: {domains}. "
+    "The hypothesis is: {hypothesis}. "
+    "Return ONLY the domain name from the list, or empty if uncertain. "
+    "No explanation, no formatting."
+)
+
+_BATCH_FALLBACK_TEMPLATE = (
+    "Classify each of the following hypotheses into one domain. Allowed domains: {domains}.\n"
+    "{hypotheses}\n"
+    "Return ONLY a JSON array of domain names, one per hypothesis, in input order."
+)
+
+
 class DomainResolverConfig:
     """Config wrapper for domain resolution from AdminPolicy."""
     def __init__(self):
@@ -22,10 +40,50 @@ class DomainResolverConfig:
         dr = admin_policy.algorithm.domain_resolution
         
         self.allowed_domains = dr.allowed_domains
+        # Lowercase -> canonical, so validating an LLM answer is one lookup
+        self.canonical_by_lower = {d.lower(): d for d in self.allowed_domains}
+        self.domains_str = ", ".join(self.allowed_domains)
+
+        # Load prompt contract once; {domains} is constant, so bind it here and
+        # leave only the per-hypothesis fields for llm_domain_resolution
+        template = load_prompt(admin_policy.prompt_assets.domain_resolver, fallback=_FALLBACK_TEMPLATE)
+        batch_template = load_prompt(
+            admin_policy.prompt_assets.domain_resolver_batch, fallback=_BATCH_FALLBACK_TEMPLATE
+        )
+        domains_literal = self.domains_str.replace("{", "{{").replace("}", "}}")
+        self.template = template.replace("{domains}", domains_literal)
+        self.batch_template = batch_template.replace("{domains}", domains_literal)
+        self.batch_size = max(1, dr.batch_size)
         
         logger.debug(f"DomainResolverConfig loaded: allowed={self.allowed_domains}")
 
 
+@lru_cache(maxsize=1)
+def get_domain_resolver_config() -> DomainResolverConfig:
+    """Shared DomainResolverConfig, built once per process."""
+    return DomainResolverConfig()
+
+
+def _hypothesis_text(hypothesis: Dict[str, Any]) -> str:
+    return (
+        f"Source: {hypothesis.get('source', '')}\n"
+        f"Target: {hypothesis.get('target', '')}\n"
+        f"Path: {' -> '.join(hypothesis.get('path', []))}\n"
+        f"Explanation: {hypothesis.get('explanation', '')}"
+    )
+
+
+def _validate_domain(response: str, config: DomainResolverConfig) -> Optional[str]:
+    """Map an LLM answer onto its canonical allowed domain, or None."""
+    resolved = response.strip().lower()
+
+    # Validation: must be in allowed_domains
+    domain = config.canonical_by_lower.get(resolved)
+    if domain is None:
+        logger.warning(f"LLM returned invalid domain: '{resolved}'")
+    return domain
+
+
 def llm_domain_resolution(
     hypothesis: Dict[str, Any],
     llm_client: Any,
@@ -39,40 +97,20 @@ def llm_domain_resolution(
     source = hypothesis.get("source", "")
     target = hypothesis.get("target", "")
     explanation = hypothesis.get("explanation", "")
-    path = hypothesis.get("path", [])
     
     # Format hypothesis text for prompt
-    hyp_text = (
-        f"Source: {source}\n"
-        f"Target: {target}\n"
-        f"Path: {' -> '.join(path)}\n"
-        f"Explanation: {explanation}"
-    )
-    
-    domains_str = ", ".join(config.allowed_domains)
-    
-    # Load prompt contract
-    from app.config.admin_policy import admin_policy
-    prompt_file = admin_policy.prompt_assets.domain_resolver
-    template = load_prompt(
-        prompt_file, 
-        fallback="Classify the following hypothesis domain. Allowed domains: {domains}. "
-                 "The hypothesis is: {hypothesis}. "
-                 "Return ONLY the domain name from the list, or empty if uncertain. "
-                 "No explanation, no formatting."
-    )
+    hyp_text = _hypothesis_text(hypothesis)
     
     try:
-        prompt = template.format(
+        prompt = config.template.format(
             hypothesis=hyp_text, 
-            domains=domains_str,
             source=source,
             target=target,
             explanation=explanation
         )
     except KeyError as e:
         logger.warning(f"Prompt template missing variable: {e}. Falling back to basic format.")
-        prompt = f"Classify hypothesis: {hyp_text}. Domains: {domains_str}"
+        prompt = f"Classify hypothesis: {hyp_text}. Domains: {config.domains_str}"
     
     # Call global LLM service (fallback is handled inside generate())
     try:
@@ -81,15 +119,10 @@ def llm_domain_resolution(
         if not response:
             return None
             
-        resolved = response.strip().lower()
-        
-        # Validation: must be in allowed_domains
-        for domain in config.allowed_domains:
-            if resolved == domain.lower():
-                logger.info(f"Successfully resolved domain '{domain}'")
-                return domain
-        
-        logger.warning(f"LLM returned invalid domain: '{resolved}'")
+        domain = _validate_domain(response, config)
+        if domain:
+            logger.info(f"Successfully resolved domain '{domain}'")
+            return domain
         
     except Exception as e:
         logger.error(f"Domain resolution failed at service level: {e}")
@@ -97,6 +130,165 @@ def llm_domain_resolution(
     return None
 
 
+def _parse_domain_list(response: str, expected: int) -> Optional[List[Any]]:
+    """Extract the JSON array from a batch response; None unless it has one entry per hypothesis."""
+    start, end = response.find("["), response.rfind("]")
+    if start == -1 or end < start:
+        return None
+    try:
+        items = json.loads(response[start:end + 1])
+    except ValueError:
+        return None
+    if not isinstance(items, list) or len(items) != expected:
+        return None
+    return items
+
+
+def batch_llm_domain_resolution(
+    hypotheses: List[Dict[str, Any]],
+    llm_client: Any,
+    config: DomainResolverConfig
+) -> List[Optional[str]]:
+    """
+    Classify several hypotheses with a single LLM call.
+
+    Returns one domain (or None) per hypothesis, in input order. If the
+    batch answer cannot be parsed, falls back to one call per hypothesis.
+    """
+    if len(hypotheses) == 1:
+        return [llm_domain_resolution(hypotheses[0], llm_client, config)]
+
+    block = "\n\n".join(
+        f"{i}.\n{_hypothesis_text(h)}" for i, h in enumerate(hypotheses, 1)
+    )
+
+    items = None
+    try:
+        response = llm_client.generate(config.batch_template.format(hypotheses=block))
+        items = _parse_domain_list(response or "", len(hypotheses))
+    except Exception as e:
+        logger.error(f"Batch domain resolution failed at service level: {e}")
+
+    if items is None:
+        logger.warning(f"Batch domain resolution unusable for {len(hypotheses)} hypotheses; resolving individually")
+        return [llm_domain_resolution(h, llm_client, config) for h in hypotheses]
+
+    return [_validate_domain(str(item), config) for item in items]
+
+
+_RESULT_CACHE_PREFIX = "resolver:domain:"
+_RESULT_CACHE_TTL = 30 * 24 * 3600  # 30 days
+
+
+def _result_cache_key(hypothesis: Dict[str, Any], config: DomainResolverConfig) -> str:
+    """Stable key over everything that reaches the prompt (incl. the bound template)."""
+    explanation = " ".join((hypothesis.get("explanation") or "").split()).lower()
+    material = "\x1f".join((
+        hypothesis.get("source") or "",
+        hypothesis.get("target") or "",
+        "\x1e".join(hypothesis.get("path") or []),
+        explanation,
+        config.template,
+    ))
+    digest = hashlib.blake2b(material.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{_RESULT_CACHE_PREFIX}{digest}"
+
+
+def _cache_get_many(keys: List[str], config: DomainResolverConfig) -> Dict[str, str]:
+    """Cached domains for keys (one MGET); stale values outside allowed_domains are ignored."""
+    r = get_redis_sync(decode_responses=True)
+    if not r or not keys:
+        return {}
+    try:
+        values = r.mget(keys)
+    except Exception:
+        return {}
+    return {
+        key: value for key, value in zip(keys, values)
+        if value and value in config.allowed_domains
+    }
+
+
+def _cache_set_many(entries: Dict[str, str]) -> None:
+    r = get_redis_sync(decode_responses=True)
+    if not r or not entries:
+        return
+    try:
+        pipe = r.pipeline(transaction=False)
+        for key, domain in entries.items():
+            pipe.set(key, domain, ex=_RESULT_CACHE_TTL)
+        pipe.execute()
+    except Exception:
+        pass
+
+
+def cached_domain_resolution(
+    hypothesis: Dict[str, Any],
+    llm_client: Any,
+    config: DomainResolverConfig
+) -> Optional[str]:
+    """
+    llm_domain_resolution memoized in Redis across jobs.
+
+    Only valid (allowed) domains are cached; failures are retried next time.
+    """
+    key = _result_cache_key(hypothesis, config)
+
+    # Try cache hit
+    cached = _cache_get_many([key], config)
+    if key in cached:
+        return cached[key]
+
+    # Cache miss — ask the LLM and store
+    domain = llm_domain_resolution(hypothesis, llm_client, config)
+    if domain:
+        _cache_set_many({key: domain})
+    return domain
+
+
+def resolve_domains(
+    hypotheses: List[Dict[str, Any]],
+    job_config: Dict[str, Any],
+    llm_client: Any
+) -> List[Optional[str]]:
+    """
+    Batch counterpart of resolve_domain: one domain (or None) per hypothesis, in order.
+
+    Cache hits are served with a single MGET; the remaining distinct
+    hypotheses are classified config.batch_size at a time per LLM call.
+    """
+    # 1. Job Override Check
+    job_override = job_config.get("domain")
+    if job_override:
+        logger.info(f"Using job override domain: {job_override}")
+        return [job_override] * len(hypotheses)
+
+    config = get_domain_resolver_config()
+    keys = [_result_cache_key(h, config) for h in hypotheses]
+
+    # 2. Cached results
+    resolved = _cache_get_many(list(dict.fromkeys(keys)), config)
+
+    # 3. Batched LLM calls, once per distinct uncached hypothesis
+    pending = {}
+    for key, hypothesis in zip(keys, hypotheses):
+        if key not in resolved:
+            pending.setdefault(key, hypothesis)
+
+    pending_items = list(pending.items())
+    fresh = {}
+    for i in range(0, len(pending_items), config.batch_size):
+        chunk = pending_items[i:i + config.batch_size]
+        domains = batch_llm_domain_resolution([h for _, h in chunk], llm_client, config)
+        for (key, _), domain in zip(chunk, domains):
+            if domain:
+                fresh[key] = domain
+
+    _cache_set_many(fresh)
+    resolved.update(fresh)
+    return [resolved.get(key) for key in keys]
+
+
 def resolve_domain(
     hypothesis: Dict[str, Any],
     job_config: Dict[str, Any],
@@ -107,7 +299,8 @@ def resolve_domain(
     
     Contract Flow:
     1. Job Override Check
-    2. LLM Fallback Loop
+    2. Cached result for an identical hypothesis
+    3. LLM Fallback Loop
     """
     # 1. Job Override Check
     job_override = job_config.get("domain")
@@ -116,5 +309,5 @@ def resolve_domain(
         return job_override
         
     # 2. LLM-based automatic resolution
-    config = DomainResolverConfig()
-    return llm_domain_resolution(hypothesis, llm_client, config)
+    config = get_domain_resolver_config()
+    return cached_domain_resolution(hypothesis, llm_client, config)
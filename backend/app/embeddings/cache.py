@@ -3,10 +3,15 @@
 Caches node text -> embedding vector to avoid re-embedding unchanged nodes.
 Uses Redis for distributed cache, falls back to in-memory dict.
 """
+import asyncio
+import hashlib
 import logging
+import weakref
+from collections import OrderedDict
 from typing import Dict, Optional, List
 import numpy as np
 
+from app.config.admin_policy import admin_policy
 from app.config.system_settings import system_settings
 
 logger = logging.getLogger(__name__)
@@ -17,6 +22,53 @@ try:
 except ImportError:
     REDIS_AVAILABLE = False
 
+# Per-job embedding hashes expire 30 days after their last write
+CACHE_TTL_SECONDS = 30 * 24 * 3600
+
+# Connections shared by every job's EmbeddingCache on the same event loop
+REDIS_MAX_CONNECTIONS = 64
+
+# redis.asyncio connections are bound to the loop that opened them, and tasks
+# may each run under their own asyncio.run(), so keep one client per loop.
+# Entries go away with their loop.
+_redis_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, redis.Redis]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_redis():
+    """Return the async Redis client for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _redis_clients.get(loop)
+    if client is None:
+        pool = redis.ConnectionPool.from_url(
+            system_settings.REDIS_URL,
+            max_connections=REDIS_MAX_CONNECTIONS,
+        )
+        client = redis.Redis(connection_pool=pool)
+        _redis_clients[loop] = client
+    return client
+
+
+# Stored values are a 2-byte dtype tag + vector bytes. Vectors are kept as
+# float16 (half the memory and transfer).
+_TAG_FLOAT16 = b"f2"
+
+
+def _field(node_text: str) -> str:
+    """Fixed-size hash field for a node text (32 hex chars regardless of text length)."""
+    return hashlib.blake2b(node_text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _encode_embedding(embedding: np.ndarray) -> bytes:
+    """Serialize an embedding for Redis as tagged float16."""
+    return _TAG_FLOAT16 + embedding.astype(np.float16).tobytes()
+
+
+def _decode_embedding(raw: bytes) -> np.ndarray:
+    """Deserialize a stored embedding to a float32 vector."""
+    return np.frombuffer(raw[len(_TAG_FLOAT16):], dtype=np.float16).astype(np.float32)
+
 
 class EmbeddingCache:
     """Cache for node embeddings to avoid re-embedding."""
@@ -24,26 +76,41 @@ class EmbeddingCache:
     def __init__(self, job_id: int):
         self.job_id = job_id
         self.cache_key = f"job:{job_id}:embeddings"
-        self.redis_client = None
-        self.memory_cache: Dict[str, np.ndarray] = {}
-        
-        if REDIS_AVAILABLE:
-            try:
-                self.redis_client = redis.from_url(system_settings.REDIS_URL)
-            except Exception as e:
-                logger.warning(f"Redis unavailable for embedding cache: {e}, using memory cache")
+        # LRU: least recently used entries are evicted past memory_max_entries
+        self.memory_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self.memory_max_entries = admin_policy.caching.embedding_memory_max_entries
+    
+    @staticmethod
+    def _redis():
+        """Redis client for the running loop, or None (memory cache only)."""
+        if not REDIS_AVAILABLE:
+            return None
+        try:
+            return _get_redis()
+        except Exception as e:
+            logger.debug(f"Redis unavailable for embedding cache: {e}, using memory cache")
+            return None
+    
+    def _remember(self, node_text: str, vector: np.ndarray) -> None:
+        """Insert into the memory LRU, evicting the least recently used entries."""
+        self.memory_cache[node_text] = vector
+        self.memory_cache.move_to_end(node_text)
+        while len(self.memory_cache) > self.memory_max_entries:
+            self.memory_cache.popitem(last=False)
     
     async def get(self, node_text: str) -> Optional[np.ndarray]:
         """Get cached embedding for a node."""
         if node_text in self.memory_cache:
+            self.memory_cache.move_to_end(node_text)
             return self.memory_cache[node_text]
         
-        if self.redis_client:
+        redis_client = self._redis()
+        if redis_client:
             try:
-                cached = await self.redis_client.hget(self.cache_key, node_text)
+                cached = await redis_client.hget(self.cache_key, _field(node_text))
                 if cached:
-                    vector = np.frombuffer(cached, dtype=np.float32)
-                    self.memory_cache[node_text] = vector
+                    vector = _decode_embedding(cached)
+                    self._remember(node_text, vector)
                     return vector
             except Exception as e:
                 logger.debug(f"Redis cache get failed: {e}")
@@ -52,26 +119,54 @@ class EmbeddingCache:
     
     async def set(self, node_text: str, embedding: np.ndarray) -> None:
         """Cache an embedding vector."""
-        self.memory_cache[node_text] = embedding
+        await self.set_multiple({node_text: embedding})
+    
+    async def set_multiple(self, embeddings: Dict[str, np.ndarray]) -> None:
+        """Cache several embedding vectors (one HSET + EXPIRE round trip)."""
+        if not embeddings:
+            return
+        
+        for text, embedding in embeddings.items():
+            self._remember(text, embedding)
         
-        if self.redis_client:
+        redis_client = self._redis()
+        if redis_client:
             try:
-                await self.redis_client.hset(
-                    self.cache_key,
-                    node_text,
-                    embedding.astype(np.float32).tobytes()
-                )
-                await self.redis_client.expire(self.cache_key, 30 * 24 * 3600)
+                mapping = {
+                    _field(text): _encode_embedding(embedding)
+                    for text, embedding in embeddings.items()
+                }
+                async with redis_client.pipeline(transaction=False) as pipe:
+                    pipe.hset(self.cache_key, mapping=mapping)
+                    pipe.expire(self.cache_key, CACHE_TTL_SECONDS)
+                    await pipe.execute()
             except Exception as e:
                 logger.debug(f"Redis cache set failed: {e}")
     
     async def get_multiple(self, node_texts: List[str]) -> Dict[str, np.ndarray]:
-        """Get multiple cached embeddings."""
-        cached = {}
-        for text in node_texts:
-            embedding = await self.get(text)
-            if embedding is not None:
-                cached[text] = embedding
+        """Get multiple cached embeddings (one Redis round trip for all misses)."""
+        # Memory hits resolve synchronously; a fully warm call never awaits
+        memory_cache = self.memory_cache
+        cached = {text: memory_cache[text] for text in node_texts if text in memory_cache}
+        for text in cached:
+            memory_cache.move_to_end(text)
+        # Unique misses, in request order (repeated texts are fetched once)
+        missing = list(dict.fromkeys(text for text in node_texts if text not in memory_cache))
+        
+        redis_client = self._redis() if missing else None
+        if redis_client:
+            try:
+                values = await redis_client.hmget(
+                    self.cache_key, [_field(text) for text in missing]
+                )
+                for text, value in zip(missing, values):
+                    if value:
+                        vector = _decode_embedding(value)
+                        self._remember(text, vector)
+                        cached[text] = vector
+            except Exception as e:
+                logger.debug(f"Redis cache get_multiple failed: {e}")
+        
         return cached
 
 
@@ -4,11 +4,15 @@ Handles streaming downloads of PDFs prioritized by impact score,
 records them in the strategic ledger, and prepares them for ingestion.
 """
 
+import hashlib
 import logging
 import os
+import re
 import httpx
+import random
 import time
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Tuple
 from pathlib import Path
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
@@ -19,9 +23,26 @@ from app.storage.models import (
     JobPaperEvidence, IngestionSourceType
 )
 from app.config.admin_policy import admin_policy
+from app.fetching.providers.rate_limit import parse_retry_after
 
 logger = logging.getLogger(__name__)
 
+# Anything but a (Unicode) letter or digit becomes "_" in stored filenames
+_UNSAFE_FILENAME_CHARS = re.compile(r"[\W_]")
+
+# Ledger updates and registrations are committed in chunks of this many papers
+COMMIT_BATCH_SIZE = 50
+
+# Bytes per read/write while streaming a PDF to disk
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# Retry backoff: min(cap, base * 2**attempt), scaled by a 0.5-1.5x jitter
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+# Upper bound on a server-supplied Retry-After, so one host cannot park a worker
+RETRY_AFTER_MAX = 120.0
+RETRY_AFTER_STATUSES = {429, 503}
+
 
 class PaperDownloader:
     """
@@ -39,6 +60,7 @@ class PaperDownloader:
         self.base_dir = Path(base_storage_dir)
         self.max_retries = admin_policy.query_orchestrator.fetch_params.retry_attempts
         self.timeout = admin_policy.query_orchestrator.fetch_params.timeout_seconds
+        self.max_concurrent_downloads = admin_policy.downloader.max_concurrent_downloads
 
     def process_job_downloads(self, job_id: int):
         """
@@ -61,102 +83,203 @@ class PaperDownloader:
                 return 0
 
             downloaded_count = 0
-            for evidence in pending:
-                paper = session.query(Paper).get(evidence.paper_id)
-                if not paper or not paper.pdf_url:
-                    logger.warning(f"Paper {evidence.paper_id} has no URL or not found; skipping.")
-                    evidence.evaluated = True # Mark as "processed" even if skipped to avoid infinite loops
-                    session.commit()
-                    continue
-
-                success = self._download_and_register(session, job_id, paper, evidence)
-                if success:
-                    downloaded_count += 1
-                
-                # Mark as evaluated in the ledger
-                evidence.evaluated = True
+            to_download = []
+            # Load all referenced papers in one round-trip
+            paper_ids = [e.paper_id for e in pending]
+            papers = {p.id: p for p in session.query(Paper).filter(Paper.id.in_(paper_ids))}
+
+            try:
+                for evidence in pending:
+                    paper = papers.get(evidence.paper_id)
+                    if not paper or not paper.pdf_url:
+                        logger.warning(f"Paper {evidence.paper_id} has no URL or not found; skipping.")
+                        evidence.evaluated = True # Mark as "processed" even if skipped to avoid infinite loops
+                        continue
+                    # Resolve plain values here: worker threads must not touch ORM state
+                    to_download.append((evidence, paper, paper.pdf_url, self._target_filename(paper, evidence)))
+
+                # Persist skips before the (slow) network phase
                 session.commit()
 
+                # 2. Download concurrently (network-bound); the session stays on this thread
+                downloads = self._download_all(job_id, to_download)
+
+                # 3. Register results sequentially, committing in chunks
+                for i, ((evidence, paper, _, _), download) in enumerate(zip(to_download, downloads), 1):
+                    if download is not None and self._register(session, job_id, paper, *download):
+                        downloaded_count += 1
+
+                    # Mark as evaluated in the ledger
+                    evidence.evaluated = True
+                    if i % COMMIT_BATCH_SIZE == 0:
+                        session.commit()
+
+                session.commit()
+            except Exception:
+                session.rollback()
+                raise
+
             logger.info(f"Completed downloads for job {job_id}. Total: {downloaded_count}")
             return downloaded_count
 
-    def _download_and_register(
-        self, 
-        session: Session, 
-        job_id: int, 
-        paper: Paper, 
-        evidence: JobPaperEvidence
-    ) -> bool:
-        """
-        Internal helper to download, store, and register a single paper.
-        """
+    def _download_all(self, job_id: int, items: List[Tuple[Any, ...]]) -> List[Optional[Tuple[Path, str]]]:
+        """Download (evidence, paper, url, filename) items with bounded concurrency, in input order."""
+        if not items:
+            return []
+
         # Create storage directory
         job_dir = self.base_dir / str(job_id) / "original"
         job_dir.mkdir(parents=True, exist_ok=True)
 
+        workers = max(1, min(self.max_concurrent_downloads, len(items)))
+        if workers == 1:
+            return [self._download(url, job_dir / filename) for _, _, url, filename in items]
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="paper-download") as pool:
+            return list(pool.map(
+                lambda item: self._download(item[2], job_dir / item[3]),
+                items
+            ))
+
+    @staticmethod
+    def _target_filename(paper: Paper, evidence: JobPaperEvidence) -> str:
         # File naming convention: <impact_score>_<paper_id>.pdf
-        safe_title = "".join([c if c.isalnum() else "_" for c in paper.title[:30]])
-        filename = f"{int(evidence.impact_score)}_{paper.id}_{safe_title}.pdf"
-        file_path = job_dir / filename
+        safe_title = _UNSAFE_FILENAME_CHARS.sub("_", paper.title[:30])
+        return f"{int(evidence.impact_score)}_{paper.id}_{safe_title}.pdf"
+
+    def _download(self, url: str, file_path: Path) -> Optional[Tuple[Path, str]]:
+        """
+        Download a single PDF to file_path.
 
+        Thread-safe: touches only the filesystem and network, never the session.
+        Returns (stored path, sha256 hex digest), or None if the download failed.
+        """
         # Download with retries
         try:
-            download_success = self._stream_download(paper.pdf_url, str(file_path))
-            if not download_success:
+            digest = self._stream_download(url, str(file_path))
+            if digest:
+                return file_path, digest
+        except Exception as e:
+            logger.error(f"Failed to download {url}: {e}")
+        return None
+
+    def _register(self, session: Session, job_id: int, paper: Paper, file_path: Path, digest: str) -> bool:
+        """
+        Register a downloaded paper as File and IngestionSource entries.
+
+        Content already registered for this job is dropped (it would be
+        extracted twice); content stored by another job is hard-linked.
+        """
+        try:
+            # Same bytes already ingested for this job (e.g. a duplicate paper record)
+            registered = session.query(File.stored_path).filter(
+                File.job_id == job_id, File.content_sha256 == digest
+            ).first()
+            if registered:
+                logger.info(f"Paper {paper.id} PDF already registered for job {job_id}; skipping")
+                if registered[0] != str(file_path):
+                    file_path.unlink(missing_ok=True)
                 return False
 
-            # Register File record
-            file_record = File(
-                job_id=job_id,
-                paper_id=paper.id,
-                origin_type="paper_download",
-                stored_path=str(file_path),
-                original_filename=filename,
-                file_type="pdf"
-            )
-            session.add(file_record)
-            session.flush()
-
-            # Register IngestionSource
-            source = IngestionSource(
-                job_id=job_id,
-                source_type=IngestionSourceType.PDF_TEXT.value,
-                source_ref=f"file:{file_record.id}",
-                raw_text="",
-                processed=False
-            )
-            session.add(source)
-            
-            logger.info(f"Registered paper {paper.id} as File {file_record.id} and IngestionSource {source.id}")
+            # Same bytes stored for another job: share the inode instead of a second copy
+            existing = session.query(File.stored_path).filter(File.content_sha256 == digest).first()
+            if existing and existing[0] != str(file_path):
+                _link_duplicate(file_path, Path(existing[0]))
+
+            # Savepoint: a failed registration must not poison the pending batch
+            with session.begin_nested():
+                # Register File record
+                file_record = File(
+                    job_id=job_id,
+                    paper_id=paper.id,
+                    origin_type="paper_download",
+                    stored_path=str(file_path),
+                    original_filename=file_path.name,
+                    file_type="pdf",
+                    content_sha256=digest
+                )
+                session.add(file_record)
+                session.flush()
+
+                # Register IngestionSource
+                source = IngestionSource(
+                    job_id=job_id,
+                    source_type=IngestionSourceType.PDF_TEXT.value,
+                    source_ref=f"file:{file_record.id}",
+                    raw_text="",
+                    processed=False
+                )
+                session.add(source)
+
+            logger.info(f"Registered paper {paper.id} as File {file_record.id}")
             return True
 
         except Exception as e:
             logger.error(f"Failed to process download for paper {paper.id}: {e}")
             return False
 
-    def _stream_download(self, url: str, target_path: str) -> bool:
-        """Stream download from URL to file with retries."""
+    def _stream_download(self, url: str, target_path: str) -> Optional[str]:
+        """Stream download from URL to file with retries; returns the content's sha256 hex digest."""
+        # Written beside the target and renamed into place only once complete: a
+        # failed attempt leaves no truncated PDF, and replacing (rather than
+        # truncating) the target never writes through a hard link to another job's file
+        part_path = target_path + ".part"
         for attempt in range(self.max_retries):
+            retry_after = None
             try:
                 with httpx.stream("GET", url, follow_redirects=True, timeout=self.timeout) as response:
                     if response.status_code != 200:
                         logger.warning(f"Failed to download {url}: Status {response.status_code} (Attempt {attempt+1})")
-                        time.sleep(2)
-                        continue
+                        if response.status_code in RETRY_AFTER_STATUSES:
+                            retry_after = parse_retry_after(response.headers.get("retry-after"))
+                    else:
+                        # Raw bytes skip httpx's decode pass; only safe without a content-encoding
+                        if response.headers.get("content-encoding", "identity") == "identity":
+                            chunks = response.iter_raw(chunk_size=DOWNLOAD_CHUNK_SIZE)
+                        else:
+                            chunks = response.iter_bytes(chunk_size=DOWNLOAD_CHUNK_SIZE)
 
-                    with open(target_path, "wb") as f:
-                        for chunk in response.iter_bytes(chunk_size=8192):
-                            f.write(chunk)
-                
-                logger.info(f"Successfully downloaded {url} to {target_path}")
-                return True
+                        # Hash alongside the write; hashlib's sha256 is hardware-accelerated
+                        hasher = hashlib.sha256()
+                        # Buffered writer: write() always consumes the whole chunk
+                        with open(part_path, "wb") as f:
+                            for chunk in chunks:
+                                hasher.update(chunk)
+                                f.write(chunk)
+                        os.replace(part_path, target_path)
+
+                        logger.info(f"Successfully downloaded {url} to {target_path}")
+                        return hasher.hexdigest()
 
             except Exception as e:
                 logger.warning(f"Download error for {url}: {e} (Attempt {attempt+1})")
-                time.sleep(2)
+                Path(part_path).unlink(missing_ok=True)
+
+            if attempt < self.max_retries - 1:
+                time.sleep(_retry_delay(attempt, retry_after))
 
         logger.error(f"Max retries exceeded for {url}")
-        return False
+        return None
+
+
+def _link_duplicate(file_path: Path, existing_path: Path) -> None:
+    """Replace file_path with a hard link to existing_path; keeps the copy if linking fails."""
+    if not existing_path.is_file():
+        return
+    tmp_path = file_path.with_name(file_path.name + ".link")
+    try:
+        os.link(existing_path, tmp_path)
+        os.replace(tmp_path, file_path)
+    except OSError as e:
+        tmp_path.unlink(missing_ok=True)
+        logger.debug(f"Could not hard-link {file_path} to {existing_path}: {e}")
+
+
+def _retry_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """Seconds to wait before the next attempt; a server Retry-After wins over backoff."""
+    if retry_after is not None:
+        return min(retry_after, RETRY_AFTER_MAX)
+    return min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt) * (0.5 + random.random())
 
 
 def get_paper_downloader() -> PaperDownloader:
@@ -0,0 +1,100 @@
+"""
+Redis-backed token bucket for provider rate limits.
+
+Every Celery worker (and every provider instance inside it) that uses the
+same key draws from one bucket, so the configured rate holds globally
+instead of once per process.
+"""
+import logging
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from app.storage.redis_client import get_redis_sync
+
+logger = logging.getLogger(__name__)
+
+# Reserve one token atomically. The bucket may go negative: the caller is
+# told how long to wait for its (already reserved) token, so concurrent
+# callers queue up behind each other instead of polling.
+# Clock comes from Redis TIME, so workers with skewed clocks agree.
+_REFILL = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or capacity
+local ts = tonumber(state[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+"""
+
+_STORE = """
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil((capacity - tokens) / rate * 1000) + 1000)
+"""
+
+_ACQUIRE_SCRIPT = _REFILL + """
+tokens = tokens - 1
+local wait = 0
+if tokens < 0 then
+    wait = -tokens / rate
+end
+""" + _STORE + """
+return tostring(wait)
+"""
+
+# Drain the bucket so the next acquire() waits at least ARGV[3] seconds
+_PENALIZE_SCRIPT = _REFILL + """
+tokens = math.min(tokens, 1 - tonumber(ARGV[3]) * rate)
+""" + _STORE
+
+class TokenBucket:
+    """
+    Token bucket shared through Redis.
+
+    capacity: burst size (tokens available after an idle period).
+    refill_per_sec: sustained rate in requests per second.
+    """
+
+    def __init__(self, redis_client, key: str, capacity: float, refill_per_sec: float):
+        self.key = key
+        self.capacity = max(1.0, float(capacity))
+        self.refill_per_sec = float(refill_per_sec)
+        self._acquire = redis_client.register_script(_ACQUIRE_SCRIPT)
+        self._penalize = redis_client.register_script(_PENALIZE_SCRIPT)
+
+    def acquire(self) -> float:
+        """Reserve one request; returns the seconds to sleep before sending it."""
+        return float(self._acquire(keys=[self.key], args=[self.capacity, self.refill_per_sec]))
+
+    def penalize(self, seconds: float) -> None:
+        """Push every caller back by `seconds` (e.g. after the server says Retry-After)."""
+        self._penalize(keys=[self.key], args=[self.capacity, self.refill_per_sec, seconds])
+
+
+def get_token_bucket(key: str, capacity: float, refill_per_sec: float) -> Optional[TokenBucket]:
+    """Build a shared bucket, or None if Redis is unreachable (callers fall back to local pacing)."""
+    if refill_per_sec <= 0:
+        return None
+    r = get_redis_sync()
+    if r is None:
+        return None
+    return TokenBucket(r, key, capacity, refill_per_sec)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,52 @@
+"""
+Cross-job cache for provider search responses.
+
+Jobs frequently issue the same search (popular entities, verification
+queries, restarted jobs). Normalized results are kept in Redis, zlib-
+compressed, for a short TTL so repeats skip the network and the rate
+limiter entirely. Redis (not a per-host file) is used so every worker
+shares the cache.
+"""
+import hashlib
+import json
+import logging
+import zlib
+from typing import Any, Dict, List, Optional
+
+from app.storage.redis_client import get_redis_sync
+
+logger = logging.getLogger(__name__)
+
+_CACHE_PREFIX = "fetch:resp:"
+
+def response_cache_key(provider: str, params: Dict[str, Any]) -> str:
+    """Stable key over the provider name and its request parameters."""
+    material = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+    digest = hashlib.sha256(f"{provider}|{material}".encode("utf-8")).hexdigest()
+    return f"{_CACHE_PREFIX}{provider}:{digest}"
+
+
+def get_cached_response(key: str) -> Optional[List[Dict[str, Any]]]:
+    """Cached normalized results, or None on miss / Redis failure."""
+    r = get_redis_sync()
+    if not r:
+        return None
+    try:
+        body = r.get(key)
+        if body is None:
+            return None
+        return json.loads(zlib.decompress(body))
+    except Exception as e:
+        logger.debug(f"ResponseCache: read failed for {key}: {e}")
+        return None
+
+
+def set_cached_response(key: str, results: List[Dict[str, Any]], ttl_seconds: int) -> None:
+    r = get_redis_sync()
+    if not r or ttl_seconds <= 0:
+        return
+    try:
+        body = zlib.compress(json.dumps(results, separators=(",", ":")).encode("utf-8"))
+        r.set(key, body, ex=ttl_seconds)
+    except Exception as e:
+        logger.debug(f"ResponseCache: write failed for {key}: {e}")
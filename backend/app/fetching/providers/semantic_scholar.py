@@ -1,15 +1,44 @@
 """
 Semantic Scholar paper provider with authentication and rate-limiting.
 """
+import json
 import logging
+import threading
 import time
 from typing import Dict, Any, List, Optional
 import requests
+from requests.adapters import HTTPAdapter
 
 from app.fetching.providers.base import BaseFetchProvider
+from app.fetching.providers.rate_limit import get_token_bucket, parse_retry_after
+from app.fetching.providers.response_cache import (
+    get_cached_response, response_cache_key, set_cached_response
+)
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on a server-supplied Retry-After before retrying a search
+RETRY_AFTER_MAX = 60.0
+
+# Shared HTTP session: urllib3 keeps connections to the API alive across
+# queries (and provider instances), so only the first call pays TCP+TLS setup.
+_http_session: Optional[requests.Session] = None
+
+def _get_http_session() -> requests.Session:
+    """Lazily create the process-wide requests.Session for Semantic Scholar."""
+    global _http_session
+    if _http_session is None:
+        session = requests.Session()
+        # Retries are handled in _do_fetch; the adapter only pools connections
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
+        session.headers.update({
+            "User-Agent": "MainProject-FETCH-More-Pipeline",
+            "Accept": "application/json"
+        })
+        _http_session = session
+    return _http_session
+
+
 class SemanticScholarProvider(BaseFetchProvider):
     """
     Semantic Scholar provider with API Key auth and strict rate limiting (1 req/sec).
@@ -20,27 +49,57 @@ class SemanticScholarProvider(BaseFetchProvider):
         self.api_key = self.credentials.get("api_key")
         self.base_url = self.credentials.get("base_url", "https://api.semanticscholar.org/graph/v1/paper/search")
         self._last_call_time = 0.0
+        # Concurrent fetches share this instance; the lock keeps their starts spaced
+        self._rate_lock = threading.Lock()
         
         # Load retry/timeout config from admin_policy
         from app.config.admin_policy import admin_policy
         self.max_retries = admin_policy.query_orchestrator.fetch_params.retry_attempts
         self.timeout = admin_policy.query_orchestrator.fetch_params.timeout_seconds
 
+        # Global (cross-worker) pacing; None falls back to per-instance spacing
+        provider_policy = admin_policy.fetch_apis.providers.get("semantic_scholar")
+        self._response_cache_ttl = provider_policy.response_cache_ttl_seconds if provider_policy else 0
+        # Read once: admin_policy is loaded at import and not reloaded at runtime
+        self._rate_limit_wait = provider_policy.rate_limit_wait_seconds if provider_policy else 2.0
+        self._bucket = None
+        if self._rate_limit_wait > 0:
+            self._bucket = get_token_bucket(
+                "semantic_scholar:rl",
+                capacity=provider_policy.rate_limit_burst if provider_policy else 1,
+                refill_per_sec=1.0 / self._rate_limit_wait
+            )
+
     
     def _wait_for_rate_limit(self):
         """Rate limiting: apply configured wait time between requests."""
-        from app.config.admin_policy import admin_policy
-        
-        wait_time = 2.0  # default
-        provider_policy = admin_policy.fetch_apis.providers.get("semantic_scholar")
-        if provider_policy:
-            wait_time = provider_policy.rate_limit_wait_seconds
-        
-        elapsed = time.time() - self._last_call_time
-        if elapsed < wait_time:
-            logger.debug(f"SemanticScholarProvider: rate limiting, sleeping {wait_time - elapsed:.2f}s")
-            time.sleep(wait_time - elapsed)
-        self._last_call_time = time.time()
+        if self._bucket is not None:
+            try:
+                delay = self._bucket.acquire()
+                if delay > 0:
+                    logger.debug(f"SemanticScholarProvider: rate limiting, sleeping {delay:.2f}s")
+                    time.sleep(delay)
+                return
+            except Exception as e:
+                logger.warning(f"SemanticScholarProvider: shared rate limiter unavailable ({e}); pacing locally")
+
+        wait_time = self._rate_limit_wait
+        with self._rate_lock:
+            # Monotonic clock: wall-clock adjustments cannot skew the spacing
+            elapsed = time.monotonic() - self._last_call_time
+            if elapsed < wait_time:
+                logger.debug(f"SemanticScholarProvider: rate limiting, sleeping {wait_time - elapsed:.2f}s")
+                time.sleep(wait_time - elapsed)
+            self._last_call_time = time.monotonic()
+
+    def _penalize_rate_limit(self, seconds: float):
+        """Make other workers sharing the bucket back off too after a 429."""
+        if self._bucket is None:
+            return
+        try:
+            self._bucket.penalize(seconds)
+        except Exception as e:
+            logger.debug(f"SemanticScholarProvider: could not penalize shared rate limiter: {e}")
 
     def fetch(self, query: str, limit: int) -> List[Dict[str, Any]]:
         """
@@ -53,28 +112,37 @@ class SemanticScholarProvider(BaseFetchProvider):
         if not query:
             return []
         
-        self._wait_for_rate_limit()
-        
-        headers = {
-            "User-Agent": "MainProject-FETCH-More-Pipeline",
-            "Accept": "application/json"
-        }
-        if self.api_key:
-            self.api_key = self.api_key.strip()
-            # headers["x-api-key"] = self.api_key
-            
         api_params = {
             "query": query,
             "limit": limit,
             "fields": "title,abstract,authors,year,venue,externalIds,openAccessPdf",
             "openAccessPdf": ""  # Filter: only return papers with public PDFs
         }
+
+        # Identical searches from any job within the TTL skip the network and rate limiter
+        cache_key = None
+        if self._response_cache_ttl > 0:
+            cache_key = response_cache_key(self.name, {"url": self.base_url, **api_params})
+            cached = get_cached_response(cache_key)
+            if cached is not None:
+                logger.info(f"SemanticScholarProvider: cache hit for '{query}' (limit={limit}, {len(cached)} papers)")
+                return cached
+        
+        self._wait_for_rate_limit()
+        
+        # Per-call headers only; User-Agent/Accept are session defaults
+        headers = {}
+        if self.api_key:
+            self.api_key = self.api_key.strip()
+            # headers["x-api-key"] = self.api_key
         
         logger.info(f"SemanticScholarProvider: fetching '{query}' (limit={limit})")
         
         try:
             results = self._do_fetch(query, limit, headers, api_params)
             logger.info(f"\n\nSemanticScholarProvider-fetched: {results}")
+            if cache_key:
+                set_cached_response(cache_key, results, self._response_cache_ttl)
             return results
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 403 and self.api_key:
@@ -97,7 +165,7 @@ class SemanticScholarProvider(BaseFetchProvider):
         
         for attempt in range(self.max_retries):
             try:
-                response = requests.get(
+                response = _get_http_session().get(
                     self.base_url,
                     params=params,
                     headers=headers,
@@ -106,8 +174,18 @@ class SemanticScholarProvider(BaseFetchProvider):
                 
                 if response.status_code == 429:
                     if attempt < self.max_retries - 1:
-                        delay = base_delay * (2 ** attempt)
-                        logger.warning(f"SemanticScholarProvider: Rate limited (429). Retrying in {delay}s (attempt {attempt + 1}/{self.max_retries})")
+                        # The server's Retry-After is authoritative; backoff only when it is absent
+                        retry_after_header = response.headers.get("Retry-After")
+                        retry_after = parse_retry_after(retry_after_header)
+                        if retry_after is not None:
+                            delay = min(retry_after, RETRY_AFTER_MAX)
+                        else:
+                            delay = base_delay * (2 ** attempt)
+                        logger.warning(
+                            f"SemanticScholarProvider: Rate limited (429, Retry-After={retry_after_header!r}). "
+                            f"Retrying in {delay}s (attempt {attempt + 1}/{self.max_retries})"
+                        )
+                        self._penalize_rate_limit(delay)
                         time.sleep(delay)
                         continue
                     else:
@@ -120,8 +198,10 @@ class SemanticScholarProvider(BaseFetchProvider):
                 
                 response.raise_for_status()
                 
-                data = response.json()
-                raw_papers = data.get("data", [])
+                # Parse the bytes directly (no decoded str copy of the body), then
+                # drop the body so only the parsed items are alive while normalizing
+                raw_papers = json.loads(response.content).get("data") or []
+                del response
                 return [self._normalize(p) for p in raw_papers]
                 
             except requests.exceptions.HTTPError as e:
@@ -138,11 +218,7 @@ class SemanticScholarProvider(BaseFetchProvider):
         external_data = item.get("externalIds", {}) or {}
         
         # Flatten external IDs
-        authors = []
-        for author in item.get("authors", []):
-            authors.append({
-                "name": author.get("name", "Unknown")
-            })
+        authors = [{"name": author.get("name", "Unknown")} for author in item.get("authors") or ()]
         
         # Extract PDF URL from openAccessPdf field
         pdf_url = None
@@ -150,13 +226,18 @@ class SemanticScholarProvider(BaseFetchProvider):
         if open_access_pdf and isinstance(open_access_pdf, dict):
             pdf_url = open_access_pdf.get("url")
             # Normalize empty strings to None
-            if pdf_url and pdf_url.strip():
-                logger.info(f"SemanticScholarProvider: Found PDF URL for '{item.get('title', 'Unknown')[:50]}...'")
-            else:
+            if not (pdf_url and pdf_url.strip()):
                 pdf_url = None
-                logger.info(f"SemanticScholarProvider: Empty PDF URL in openAccessPdf for '{item.get('title', 'Unknown')[:50]}...'")
-        else:
-            logger.info(f"SemanticScholarProvider: No openAccessPdf field for '{item.get('title', 'Unknown')[:50]}...'")
+
+        # Per-paper detail: debug only, and skip the formatting unless it will be emitted
+        if logger.isEnabledFor(logging.DEBUG):
+            title = (item.get("title") or "Unknown")[:50]
+            if pdf_url:
+                logger.debug(f"SemanticScholarProvider: Found PDF URL for '{title}...'")
+            elif isinstance(open_access_pdf, dict) and open_access_pdf:
+                logger.debug(f"SemanticScholarProvider: Empty PDF URL in openAccessPdf for '{title}...'")
+            else:
+                logger.debug(f"SemanticScholarProvider: No openAccessPdf field for '{title}...'")
         
         return {
             "title": item.get("title", "Untitled"),
@@ -9,8 +9,11 @@ import hashlib
 import logging
 import json
 import os
+from functools import lru_cache
 from typing import Dict, Any, Optional, Tuple, List
 from datetime import datetime
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.storage.models import SearchQuery, SearchQueryRun
@@ -63,14 +66,17 @@ def compute_hypothesis_signature(hypothesis: Dict[str, Any], config: Optional[Qu
     source = str(hypothesis.get("source", "")).lower()
     target = str(hypothesis.get("target", "")).lower()
     
-    # Stable hash from endpoints
-    combined = f"{source}→{target}"
-    hash_obj = hashlib.sha256(combined.encode("utf-8"))
-    signature = hash_obj.hexdigest()
-    
     if config is None:
         config = QueryOrchestratorConfig()
-    return signature[:config.signature_length]
+    return _sig_cached(source, target, config.signature_length)
+
+
+@lru_cache(maxsize=8192)
+def _sig_cached(source: str, target: str, sig_len: int) -> str:
+    # Stable hash from endpoints; BLAKE2b computes only the bytes we keep
+    combined = f"{source}→{target}"
+    hash_obj = hashlib.blake2b(combined.encode("utf-8"), digest_size=(sig_len + 1) // 2)
+    return hash_obj.hexdigest()[:sig_len]
 
 
 def get_or_create_search_query(
@@ -97,23 +103,132 @@ def get_or_create_search_query(
     Returns:
         SearchQuery model instance
     """
+    return get_or_create_search_queries(
+        [hypothesis], job_id, session,
+        focus_areas=focus_areas,
+        config=config,
+        entities=[entities],
+        query_texts=[query_text]
+    )[0]
+
+
+def get_or_create_search_queries(
+    hypotheses: List[Dict[str, Any]],
+    job_id: int,
+    session: Session,
+    focus_areas: list = None,
+    config: Optional[QueryOrchestratorConfig] = None,
+    entities: Optional[List[Optional[list]]] = None,
+    query_texts: Optional[List[str]] = None
+) -> List[SearchQuery]:
+    """
+    Batched get_or_create_search_query: one lookup and one insert for the whole list.
+    
+    Args:
+        hypotheses: Hypothesis dicts
+        job_id: Job ID
+        session: SQLAlchemy session
+        focus_areas: Optional list of keywords injected into every new query
+        config: QueryOrchestratorConfig (created if None)
+        entities: Optional per-hypothesis entity lists (parallel to hypotheses)
+        query_texts: Optional per-hypothesis custom query texts (parallel to hypotheses)
+    
+    Returns:
+        One SearchQuery per hypothesis, in input order. Hypotheses sharing a
+        signature share the same SearchQuery, as do hypotheses whose entities
+        already belong to a query of this job.
+    """
+    if not hypotheses:
+        return []
     if config is None:
         config = QueryOrchestratorConfig()
     
     focus_areas = focus_areas or []
     
-    hypothesis_signature = compute_hypothesis_signature(hypothesis, config=config)
+    signatures = [compute_hypothesis_signature(h, config=config) for h in hypotheses]
     
-    # Check if query already exists
-    existing = session.query(SearchQuery).filter(
+    # Check which queries already exist (single round-trip)
+    by_signature: Dict[str, SearchQuery] = {}
+    existing_rows = session.query(SearchQuery).filter(
         SearchQuery.job_id == job_id,
-        SearchQuery.hypothesis_signature == hypothesis_signature
-    ).first()
+        SearchQuery.hypothesis_signature.in_(set(signatures))
+    ).order_by(SearchQuery.id).all()
+    for row in existing_rows:
+        by_signature.setdefault(row.hypothesis_signature, row)
     
-    if existing:
-        logger.debug(f"Found existing SearchQuery: {existing.id} (signature={hypothesis_signature})")
-        return existing
+    # Capture current configuration snapshot
+    config_snapshot = {
+        "signature_length": config.signature_length,
+        "initial_reputation": config.initial_reputation,
+        "timestamp": datetime.utcnow().isoformat()
+    }
+    
+    pending = []  # (position in results, row dict) for signatures not yet stored
+    new_rows: Dict[str, Dict[str, Any]] = {}
+    results: List[Optional[SearchQuery]] = []
+    for i, (hypothesis, hypothesis_signature) in enumerate(zip(hypotheses, signatures)):
+        existing = by_signature.get(hypothesis_signature)
+        if existing is not None:
+            logger.debug(f"Found existing SearchQuery: {existing.id} (signature={hypothesis_signature})")
+            results.append(existing)
+            continue
+        
+        if hypothesis_signature not in new_rows:
+            new_rows[hypothesis_signature] = _search_query_row(
+                hypothesis, job_id, hypothesis_signature,
+                query_text=query_texts[i] if query_texts else "",
+                focus_areas=focus_areas,
+                config=config,
+                config_snapshot=config_snapshot,
+                entities=entities[i] if entities else None
+            )
+        pending.append((i, new_rows[hypothesis_signature]))
+        results.append(None)
+    
+    if new_rows:
+        # Rows whose (job_id, entities_hash) already exists are skipped server-side
+        # (e.g. a concurrent worker, or a row stored before a hash change)
+        created = insert_search_queries_if_absent(list(new_rows.values()), session)
+        for search_query in created:
+            by_signature[search_query.hypothesis_signature] = search_query
+            logger.info(
+                f"Created SearchQuery: {search_query.id} "
+                f"(sig={search_query.hypothesis_signature}, domain={search_query.resolved_domain}, status=new)"
+            )
+        
+        # Re-select the rows that already held those entities
+        skipped_hashes = {
+            row["entities_hash"] for row in new_rows.values()
+            if row["hypothesis_signature"] not in by_signature
+        }
+        by_entities_hash: Dict[str, SearchQuery] = {}
+        if skipped_hashes:
+            for row in session.query(SearchQuery).filter(
+                SearchQuery.job_id == job_id,
+                SearchQuery.entities_hash.in_(skipped_hashes)
+            ):
+                by_entities_hash[row.entities_hash] = row
+        
+        for i, row in pending:
+            results[i] = (
+                by_signature.get(row["hypothesis_signature"])
+                or by_entities_hash[row["entities_hash"]]
+            )
     
+    return results
+
+
+def _search_query_row(
+    hypothesis: Dict[str, Any],
+    job_id: int,
+    hypothesis_signature: str,
+    query_text: str,
+    focus_areas: list,
+    config: QueryOrchestratorConfig,
+    config_snapshot: Dict[str, Any],
+    entities: Optional[list]
+) -> Dict[str, Any]:
+    """Build the column values for a new SearchQuery for a hypothesis."""
     # Generate query text from hypothesis if not provided
     if not query_text:
         source = hypothesis.get("source", "")
@@ -130,39 +245,21 @@ def get_or_create_search_query(
     # Inherit domain from hypothesis (Domain Resolution Contract)
     resolved_domain = hypothesis.get("domain")
     
-    # Capture current configuration snapshot
-    config_snapshot = {
-        "signature_length": config.signature_length,
-        "initial_reputation": config.initial_reputation,
-        "timestamp": datetime.utcnow().isoformat()
-    }
-    
     # Handle entities and hash
     entities_used = entities or []
     entities_hash = compute_entities_hash(entities_used) if entities_used else None
     
-    # Create new SearchQuery
-    search_query = SearchQuery(
-        job_id=job_id,
-        hypothesis_signature=hypothesis_signature,
-        query_text=query_text,
-        resolved_domain=resolved_domain,
-        status="new",
-        reputation_score=config.initial_reputation,
-        config_snapshot=config_snapshot,
-        entities_used=entities_used,
-        entities_hash=entities_hash
-    )
-    
-    session.add(search_query)
-    session.flush()  # Get ID without committing
-    
-    logger.info(
-        f"Created SearchQuery: {search_query.id} "
-        f"(sig={hypothesis_signature}, domain={resolved_domain}, status=new)"
-    )
-    
-    return search_query
+    return {
+        "job_id": job_id,
+        "hypothesis_signature": hypothesis_signature,
+        "query_text": query_text,
+        "resolved_domain": resolved_domain,
+        "status": "new",
+        "reputation_score": config.initial_reputation,
+        "config_snapshot": config_snapshot,
+        "entities_used": entities_used,
+        "entities_hash": entities_hash,
+    }
 
 
 def should_run_query(
@@ -196,13 +293,13 @@ def should_run_query(
 
 from sqlalchemy import func
 
+
 def get_all_fetched_ids_for_job(
     job_id: int,
     session: Session
 ) -> List[int]:
     """
     Get all paper IDs ever fetched for a specific job.
-    Uses database-side JSONB aggregation for efficiency.
     
     Args:
         job_id: Job ID
@@ -213,14 +310,24 @@ def get_all_fetched_ids_for_job(
     """
     from app.storage.models import JobPaperEvidence
     
-    result = session.query(JobPaperEvidence.paper_id).filter(
-        JobPaperEvidence.job_id == job_id
-    ).all()
+    # Scalars skip the per-row Row wrappers
+    return list(session.scalars(
+        select(JobPaperEvidence.paper_id).where(JobPaperEvidence.job_id == job_id)
+    ))
+
+
+def get_all_fetched_ids_for_job_set(
+    job_id: int,
+    session: Session
+) -> set:
+    """
+    Same as get_all_fetched_ids_for_job, as a set for membership checks.
+    """
+    from app.storage.models import JobPaperEvidence
     
-    if not result:
-        return []
-        
-    return [row.paper_id for row in result]
+    return set(session.scalars(
+        select(JobPaperEvidence.paper_id).where(JobPaperEvidence.job_id == job_id)
+    ))
 
 
 def record_search_run(
@@ -294,9 +401,13 @@ def compute_entities_hash(entities: list) -> str:
     Returns:
         Hex hash string
     """
-    entity_str = "|".join(str(e).lower() for e in entities)
-    hash_obj = hashlib.sha256(entity_str.encode("utf-8"))
-    return hash_obj.hexdigest()[:16]
+    return _entities_hash_cached(tuple(str(e).lower() for e in entities))
+
+
+@lru_cache(maxsize=8192)
+def _entities_hash_cached(entities: Tuple[str, ...]) -> str:
+    entity_str = "|".join(entities)
+    return hashlib.blake2b(entity_str.encode("utf-8"), digest_size=8).hexdigest()
 
 
 def check_entities_duplicate(
@@ -354,8 +465,6 @@ def create_verification_search_queries(
     if config is None:
         config = QueryOrchestratorConfig()
     
-    queries = []
-    
     # Capture current config snapshot
     config_snapshot = {
         "signature_length": config.signature_length,
@@ -363,73 +472,74 @@ def create_verification_search_queries(
         "timestamp": datetime.utcnow().isoformat()
     }
     
-    # Strategy 1: Combined [source, target]
-    entities_combined = [source, target]
-    if not check_entities_duplicate(job_id, entities_combined, session):
-        query_text = f"relationship between {source} and {target}"
-        entities_hash = compute_entities_hash(entities_combined)
-        
-        sq = SearchQuery(
-            job_id=job_id,
-            hypothesis_signature=hashlib.sha256(f"{source}→{target}".encode()).hexdigest()[:16],
-            query_text=query_text,
-            resolved_domain=resolved_domain,
-            status="new",
-            reputation_score=config.initial_reputation,
-            config_snapshot=config_snapshot,
-            entities_used=entities_combined,
-            entities_hash=entities_hash,
-        )
-        session.add(sq)
-        queries.append(sq)
-        logger.info(f"Created verification query: {query_text} (entities={entities_combined})")
-    else:
-        logger.debug(f"Skipped duplicate entities: {entities_combined}")
-    
-    # Strategy 2: Source alone [A]
-    entities_source = [source]
-    if not check_entities_duplicate(job_id, entities_source, session):
-        query_text = f"related to {source}"
-        entities_hash = compute_entities_hash(entities_source)
-        
-        sq = SearchQuery(
-            job_id=job_id,
-            hypothesis_signature=hashlib.sha256(f"{source}_single".encode()).hexdigest()[:16],
-            query_text=query_text,
-            resolved_domain=resolved_domain,
-            status="new",
-            reputation_score=config.initial_reputation,
-            config_snapshot=config_snapshot,
-            entities_used=entities_source,
-            entities_hash=entities_hash,
-        )
-        session.add(sq)
-        queries.append(sq)
-        logger.info(f"Created verification query: {query_text} (entities={entities_source})")
-    else:
-        logger.debug(f"Skipped duplicate entities: {entities_source}")
-    
-    # Strategy 3: Target alone [C]
-    entities_target = [target]
-    if not check_entities_duplicate(job_id, entities_target, session):
-        query_text = f"related to {target}"
-        entities_hash = compute_entities_hash(entities_target)
-        
-        sq = SearchQuery(
-            job_id=job_id,
-            hypothesis_signature=hashlib.sha256(f"{target}_single".encode()).hexdigest()[:16],
-            query_text=query_text,
-            resolved_domain=resolved_domain,
-            status="new",
-            reputation_score=config.initial_reputation,
-            config_snapshot=config_snapshot,
-            entities_used=entities_target,
-            entities_hash=entities_hash,
-        )
-        session.add(sq)
-        queries.append(sq)
-        logger.info(f"Created verification query: {query_text} (entities={entities_target})")
-    else:
-        logger.debug(f"Skipped duplicate entities: {entities_target}")
+    # (entities, query text, signature material) in hierarchy order:
+    # combined [A, C], then source alone [A], then target alone [C]
+    strategies = [
+        ([source, target], f"relationship between {source} and {target}", f"{source}→{target}"),
+        ([source], f"related to {source}", f"{source}_single"),
+        ([target], f"related to {target}", f"{target}_single"),
+    ]
+    
+    rows = []
+    batch_hashes = set()
+    for entities, query_text, signature_material in strategies:
+        entities_hash = compute_entities_hash(entities)
+        if entities_hash in batch_hashes:
+            continue  # source == target yields the same hash twice
+        batch_hashes.add(entities_hash)
+        rows.append({
+            "job_id": job_id,
+            "hypothesis_signature": hashlib.sha256(signature_material.encode()).hexdigest()[:16],
+            "query_text": query_text,
+            "resolved_domain": resolved_domain,
+            "status": "new",
+            "reputation_score": config.initial_reputation,
+            "config_snapshot": config_snapshot,
+            "entities_used": entities,
+            "entities_hash": entities_hash,
+        })
+    
+    # Duplicates against existing rows are skipped server-side
+    queries = insert_search_queries_if_absent(rows, session)
+    for sq in queries:
+        logger.info(f"Created verification query: {sq.query_text} (entities={sq.entities_used})")
     
     return queries
+
+
+def insert_search_queries_if_absent(rows: List[Dict[str, Any]], session: Session) -> List[SearchQuery]:
+    """
+    Insert SearchQuery rows in one statement, skipping any whose
+    (job_id, entities_hash) already exists.
+    
+    Uses INSERT ... ON CONFLICT DO NOTHING RETURNING, so the duplicate check
+    cannot race with a concurrent worker inserting the same entities.
+    
+    Args:
+        rows: Column dicts for SearchQuery (must include entities_hash)
+        session: SQLAlchemy session
+    
+    Returns:
+        SearchQuery instances actually inserted (duplicates omitted)
+    """
+    if not rows:
+        return []
+    
+    stmt = pg_insert(SearchQuery).values(rows).on_conflict_do_nothing(
+        index_elements=["job_id", "entities_hash"]
+    ).returning(SearchQuery)
+    return list(session.scalars(stmt))
+
+
+# Built once so SQLAlchemy reuses the compiled SQL; projects only the needed columns
+_JOB_SEARCH_QUERIES_STMT = select(
+    SearchQuery.query_text,
+    SearchQuery.status,
+    SearchQuery.entities_used.label("entities"),
+).where(SearchQuery.job_id == bindparam("job_id"))
+
+
+def get_job_search_queries(job_id: int, session: Session) -> List[Dict[str, Any]]:
+    """Return query text, status and entities of every SearchQuery of a job."""
+    rows = session.execute(_JOB_SEARCH_QUERIES_STMT, {"job_id": job_id}).mappings()
+    return [dict(row) for row in rows]
@@ -3,6 +3,7 @@ FetchService: Singleton orchestrator for domain-aware paper fetching.
 """
 import logging
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, Any, List, Optional, Tuple
 from sqlalchemy.orm import Session
@@ -15,14 +16,14 @@ from app.fetching.selection import select_top_diverse_leads
 from app.fetching.query_orchestrator import (
     get_or_create_search_query, should_run_query, 
     record_search_run, QueryOrchestratorConfig,
-    get_all_fetched_ids_for_job
+    get_all_fetched_ids_for_job_set
 )
 from app.config.admin_policy import admin_policy
 from app.config.system_settings import system_settings
 from app.fetching.providers import PROVIDER_REGISTRY
 from app.fetching.providers.base import BaseFetchProvider
-from app.deduplication import check_duplicate, persist_paper
-from app.deduplication.fingerprinting import FingerprintConfig
+from app.deduplication import check_duplicate, persist_papers
+from app.deduplication.fingerprinting import get_fingerprint_config
 
 logger = logging.getLogger(__name__)
 
@@ -47,7 +48,7 @@ class FetchService:
             return
             
         self.providers: Dict[str, BaseFetchProvider] = {}
-        self.fingerprint_config = FingerprintConfig()
+        self.fingerprint_config = get_fingerprint_config()
         self._initialize_providers()
         self._initialized = True
         logger.info("FetchService singleton initialized")
@@ -130,8 +131,7 @@ class FetchService:
             return
 
         # 3. Load IDs for job-level dedup
-        from app.fetching.query_orchestrator import get_all_fetched_ids_for_job
-        seen_ids = set(get_all_fetched_ids_for_job(job_id, session))
+        seen_ids = get_all_fetched_ids_for_job_set(job_id, session)
         
         # 4. Create Unified Target List
         # Format: (origin_type, SearchQuery)
@@ -142,7 +142,7 @@ class FetchService:
             all_targets.append(("vanguard", v_query))
             
         # Machine Leads (Map to SearchQuery)
-        for m_hypo in machine_leads:
+        if machine_leads:
             # Get common focus areas from Job configuration
             job_obj = session.query(Job).get(job_id)
             focus_areas = []
@@ -152,14 +152,15 @@ class FetchService:
                     cfg = JobConfig(**job_obj.job_config)
                     focus_areas = cfg.query_config.focus_areas
             
-            from app.fetching.query_orchestrator import get_or_create_search_query
-            s_query = get_or_create_search_query(
-                m_hypo, job_id, session,
+            # One lookup + one flush for all leads
+            from app.fetching.query_orchestrator import get_or_create_search_queries
+            s_queries = get_or_create_search_queries(
+                machine_leads, job_id, session,
                 focus_areas=focus_areas,
                 config=query_config,
-                entities=m_hypo.get("path")
+                entities=[m_hypo.get("path") for m_hypo in machine_leads]
             )
-            all_targets.append(("machine", s_query))
+            all_targets.extend(("machine", s_query) for s_query in s_queries)
 
         # Execute the rest of discovery fetch
         self._execute_unified_fetch(job_id, all_targets, batch_size, session, seen_ids, query_config)
@@ -176,39 +177,22 @@ class FetchService:
         """
         from app.fetching.query_orchestrator import compute_entities_hash
         
-        # Check [A,B] status
-        entities_ab = [source, target]
-        hash_ab = compute_entities_hash(entities_ab)
-        query_ab = session.query(SearchQuery).filter(
-            SearchQuery.job_id == job_id,
-            SearchQuery.entities_hash == hash_ab
-        ).first()
-        
-        # If [A,B] doesn't exist or is still 'new', try it
-        if not query_ab or query_ab.status == "new":
-            return entities_ab
-        
-        # [A,B] is done, try [A]
-        entities_a = [source]
-        hash_a = compute_entities_hash(entities_a)
-        query_a = session.query(SearchQuery).filter(
-            SearchQuery.job_id == job_id,
-            SearchQuery.entities_hash == hash_a
-        ).first()
-        
-        if not query_a or query_a.status == "new":
-            return entities_a
+        hierarchy = [[source, target], [source], [target]]
+        hashes = [compute_entities_hash(entities) for entities in hierarchy]
         
-        # [A] is done, try [B]
-        entities_b = [target]
-        hash_b = compute_entities_hash(entities_b)
-        query_b = session.query(SearchQuery).filter(
+        # Status of every level in one query (first row per hash, as before)
+        status_by_hash = {}
+        for entities_hash, status in session.query(SearchQuery.entities_hash, SearchQuery.status).filter(
             SearchQuery.job_id == job_id,
-            SearchQuery.entities_hash == hash_b
-        ).first()
+            SearchQuery.entities_hash.in_(set(hashes))
+        ).order_by(SearchQuery.id):
+            status_by_hash.setdefault(entities_hash, status)
         
-        if not query_b or query_b.status == "new":
-            return entities_b
+        # First level that doesn't exist yet or is still 'new'
+        for entities, entities_hash in zip(hierarchy, hashes):
+            status = status_by_hash.get(entities_hash)
+            if status is None or status == "new":
+                return entities
         
         # All done
         return None
@@ -270,20 +254,28 @@ class FetchService:
                 else f"related to {next_entities[0]}"
             )
             
-            search_query = SearchQuery(
-                job_id=job_id,
-                hypothesis_signature=hashlib.sha256(f"verification_{entities_hash}".encode()).hexdigest()[:16],
-                query_text=query_text,
-                resolved_domain=resolved_domain,
-                status="new",
-                reputation_score=query_config.initial_reputation,
-                config_snapshot=config_snapshot,
-                entities_used=next_entities,
-                entities_hash=entities_hash,
-            )
-            session.add(search_query)
-            session.flush()
-            logger.info(f"FetchService: Created verification query for entities {next_entities}")
+            from app.fetching.query_orchestrator import insert_search_queries_if_absent
+            created = insert_search_queries_if_absent([{
+                "job_id": job_id,
+                "hypothesis_signature": hashlib.sha256(f"verification_{entities_hash}".encode()).hexdigest()[:16],
+                "query_text": query_text,
+                "resolved_domain": resolved_domain,
+                "status": "new",
+                "reputation_score": query_config.initial_reputation,
+                "config_snapshot": config_snapshot,
+                "entities_used": next_entities,
+                "entities_hash": entities_hash,
+            }], session)
+            
+            if created:
+                search_query = created[0]
+                logger.info(f"FetchService: Created verification query for entities {next_entities}")
+            else:
+                # Another worker created it since our lookup
+                search_query = session.query(SearchQuery).filter(
+                    SearchQuery.job_id == job_id,
+                    SearchQuery.entities_hash == entities_hash
+                ).one()
         
         # Step 3: Ensure query is 'new' (if it was 'done' we'd have moved to next level in step 1)
         if search_query.status != "new":
@@ -293,8 +285,7 @@ class FetchService:
         logger.info(f"FetchService: Executing verification query {search_query.id} with entities {next_entities}")
         
         # Load IDs for job-level dedup
-        from app.fetching.query_orchestrator import get_all_fetched_ids_for_job
-        seen_ids = set(get_all_fetched_ids_for_job(job_id, session))
+        seen_ids = get_all_fetched_ids_for_job_set(job_id, session)
         
         # Execute ONLY this one query in this cycle
         all_targets = [("verification", search_query)]
@@ -318,7 +309,8 @@ class FetchService:
         """
         from app.fetching.query_orchestrator import should_run_query, update_search_query_status
         
-        # 5. Execute Unified Fetch
+        # 5. Decide which targets run (DB-bound, on this thread)
+        runnable = []
         for origin, search_query in all_targets:
             try:
                 should_run, reason = should_run_query(search_query, session, config=query_config)
@@ -328,14 +320,27 @@ class FetchService:
                     continue
 
                 logger.info(f"FetchService: Executing {origin} search for query {search_query.id}")
+                runnable.append((origin, search_query, reason))
+            except Exception as e:
+                logger.error(f"FetchService: Error processing {origin} lead {search_query.id}: {e}", exc_info=True)
+                session.rollback()
 
-                # 6. Fetch via domain-aware providers
-                # Attempt to fetch; only mark the query done below if this block completes without
-                # raising an exception. A network error / 429 / provider failure will be caught and the
+        # 6. Fetch via domain-aware providers, concurrently (network-bound)
+        fetched = self._fetch_concurrently(
+            [(sq.query_text, sq.resolved_domain) for _, sq, _ in runnable], batch_size
+        )
+
+        # Persist each result sequentially (steps 7-12)
+        for (origin, search_query, reason), outcome in zip(runnable, fetched):
+            try:
+                # Only mark the query done below if this block completes without raising an
+                # exception. A network error / 429 / provider failure will be caught and the
                 # query left in 'new' state for retries. This mirrors the requirement that status must
                 # only change on a successful HTTP 200-style response.
                 try:
-                    candidates, provider_name = self.fetch_for_hypothesis(search_query, batch_size)
+                    if isinstance(outcome, Exception):
+                        raise outcome
+                    candidates, provider_name = outcome
                     papers_found = len(candidates)
                     logger.info(f"FetchService: Fetch returned {papers_found} candidate papers for query {search_query.id}")
                 except Exception as fetch_error:
@@ -419,9 +424,33 @@ class FetchService:
                 logger.error(f"FetchService: Error processing {origin} lead {search_query.id}: {e}", exc_info=True)
                 session.rollback()
 
+    def _fetch_concurrently(
+        self, queries: List[Tuple[str, Optional[str]]], limit: int
+    ) -> List[Any]:
+        """
+        Run provider searches for (query_text, resolved_domain) pairs on a thread pool.
+
+        Returns, in input order, either (results, provider_name) or the raised
+        exception. Workers get plain strings only; the session stays with the caller.
+        """
+        def run(query):
+            try:
+                return self._fetch_query(query[0], query[1], limit)
+            except Exception as e:
+                return e
+
+        workers = min(admin_policy.query_orchestrator.fetch_params.max_concurrent_fetches, len(queries))
+        if workers <= 1:
+            return [run(q) for q in queries]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="provider-fetch") as pool:
+            return list(pool.map(run, queries))
+
     def fetch_for_hypothesis(self, search_query: SearchQuery, limit: int) -> Tuple[List[Dict[str, Any]], str]:
         """Perform domain-aware provider routing."""
-        domain = search_query.resolved_domain or "default"
+        return self._fetch_query(search_query.query_text, search_query.resolved_domain, limit)
+
+    def _fetch_query(self, query_text: str, resolved_domain: Optional[str], limit: int) -> Tuple[List[Dict[str, Any]], str]:
+        domain = resolved_domain or "default"
         
         provider_order = admin_policy.fetch_apis.domain_provider_order.get(domain)
         if not provider_order:
@@ -435,7 +464,7 @@ class FetchService:
                 continue
                 
             try:
-                results = provider.fetch(search_query.query_text, limit)
+                results = provider.fetch(query_text, limit)
                 # Provider succeeded, return immediately
                 return results, name
             except Exception as e:
@@ -453,7 +482,10 @@ class FetchService:
         """
         Deduplicates against global DB and returns Paper objects for all valid candidates.
         """
-        all_papers = []
+        # One slot per candidate: known papers now, new ones after the batch insert
+        all_papers: List[Optional[Paper]] = []
+        new_candidates = []
+        new_slots = []
         
         for candidate in candidates:
             # Check for duplicate via standard framework
@@ -462,18 +494,22 @@ class FetchService:
             if dup_result.is_duplicate:
                 if dup_result.matched_paper_id is not None:
                     # Globally known paper - retrieve existing object
-                    paper = session.query(Paper).get(dup_result.matched_paper_id)
-                    if paper:
-                        all_papers.append(paper)
+                    all_papers.append(session.get(Paper, dup_result.matched_paper_id))
             else:
-                try:
-                    # Globally new paper - persist it
-                    paper = persist_paper(candidate, session, self.fingerprint_config)
-                    all_papers.append(paper)
-                except Exception as e:
-                    logger.error(f"FetchService: Failed to persist paper: {e}")
+                # Globally new paper - persisted below in a single batch
+                new_slots.append(len(all_papers))
+                new_candidates.append(candidate)
+                all_papers.append(None)
+        
+        if new_candidates:
+            try:
+                new_papers = persist_papers(new_candidates, session, self.fingerprint_config)
+                for slot, paper in zip(new_slots, new_papers):
+                    all_papers[slot] = paper
+            except Exception as e:
+                logger.error(f"FetchService: Failed to persist {len(new_candidates)} papers: {e}")
         
-        return all_papers
+        return [paper for paper in all_papers if paper is not None]
 
     def _create_ingestion_sources(self, job_id: int, papers: List[Paper], session: Session):
         """Create IngestionSource entries for new papers."""
@@ -7,17 +7,73 @@ status. No aggregation, no intent understanding, no dependencies on downstream p
 This service is idempotent and safe to retry after failures.
 """
 import logging
-from typing import Optional
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import asc
 
-from app.storage.models import Job, IngestionSource, TextBlock, File
+from app.storage.models import Job, IngestionSource, IngestionSourceType, TextBlock, File
 from app.storage.db import engine
 from app.config.admin_policy import admin_policy
 
 logger = logging.getLogger(__name__)
 
 
+def _extract_pdf_regions(file_path: str, config):
+    """Process-pool entry point: layout extraction for one PDF."""
+    from app.ingestion.adapters.pdf import PDFAdapter
+    return PDFAdapter().extract_regions(file_path, config)
+
+
+def _prefetch_pdf_regions(
+    session: Session, job_id: int, config
+) -> Tuple[Optional[ProcessPoolExecutor], Dict[int, Future]]:
+    """
+    Start parsing the job's pending file-backed PDFs in worker processes.
+
+    PDF layout extraction is CPU-bound and holds the GIL, so running it
+    ahead in processes overlaps it with the (LLM-bound) refinery of
+    earlier sources. Returns (pool, {source_id: future}); the pool is
+    None when disabled or when processes cannot be started here (e.g.
+    inside a daemonic worker), in which case extraction stays inline.
+    """
+    if config.process_workers <= 0:
+        return None, {}
+
+    rows = session.query(IngestionSource.id, IngestionSource.source_ref).filter(
+        IngestionSource.job_id == job_id,
+        IngestionSource.processed == False,
+        IngestionSource.source_type == IngestionSourceType.PDF_TEXT.value,
+        IngestionSource.source_ref.like("file:%")
+    ).order_by(asc(IngestionSource.created_at)).all()
+    if len(rows) < 2:
+        return None, {}
+
+    file_ids = {}
+    for source_id, source_ref in rows:
+        try:
+            file_ids[source_id] = int(source_ref.replace("file:", ""))
+        except ValueError:
+            continue
+    paths = dict(session.query(File.id, File.stored_path).filter(File.id.in_(set(file_ids.values()))))
+
+    workers = min(config.process_workers, len(rows))
+    pool = ProcessPoolExecutor(max_workers=workers)
+    futures = {}
+    try:
+        for source_id, file_id in file_ids.items():
+            if file_id in paths:
+                futures[source_id] = pool.submit(_extract_pdf_regions, paths[file_id], config)
+    except Exception as e:
+        logger.warning(f"IngestionService: PDF process pool unavailable ({e}); extracting inline.")
+        pool.shutdown(wait=False, cancel_futures=True)
+        return None, {}
+
+    logger.info(f"IngestionService: Prefetching {len(futures)} PDF extraction(s) on {workers} process(es).")
+    return pool, futures
+
+
 class IngestionService:
     """
     Precision Ingestion Service.
@@ -53,108 +109,125 @@ class IngestionService:
             if job.status != "READY_TO_INGEST":
                 raise RuntimeError(f"Cannot ingest job {job_id}: status is '{job.status}', expected 'READY_TO_INGEST'.")
 
-            sources_processed = 0
-            blocks_created = 0
+            extraction_config = admin_policy.algorithm.extraction
+            pool, prefetched = _prefetch_pdf_regions(session, job_id, extraction_config)
+            try:
+                return IngestionService._ingest_sources(session, job_id, prefetched)
+            finally:
+                if pool is not None:
+                    pool.shutdown(wait=False, cancel_futures=True)
 
-            while True:
-                unprocessed_source = (
-                    session.query(IngestionSource)
-                    .filter(
-                        IngestionSource.job_id == job_id,
-                        IngestionSource.processed == False
-                    )
-                    .order_by(asc(IngestionSource.created_at))
-                    .first()
+    @staticmethod
+    def _ingest_sources(session: Session, job_id: int, prefetched: Dict[int, Future]) -> dict:
+        """Ingest loop body of ingest_job; prefetched maps source id -> pending PDF extraction."""
+        sources_processed = 0
+        blocks_created = 0
+
+        while True:
+            unprocessed_source = (
+                session.query(IngestionSource)
+                .filter(
+                    IngestionSource.job_id == job_id,
+                    IngestionSource.processed == False
                 )
+                .order_by(asc(IngestionSource.created_at))
+                .first()
+            )
 
-                if not unprocessed_source:
-                    break
+            if not unprocessed_source:
+                break
 
-                logger.info(f"IngestionService: Processing Source {unprocessed_source.id} ({unprocessed_source.source_type}).")
+            logger.info(f"IngestionService: Processing Source {unprocessed_source.id} ({unprocessed_source.source_type}).")
 
-                try:
-                    # 1. Adapter Layer: Physical Extraction / DLA
-                    from app.ingestion.adapters.factory import get_adapter_for_source
-                    adapter = get_adapter_for_source(unprocessed_source.source_type, unprocessed_source.source_ref)
-                    
-                    # Decide input for adapter (Resolve file path or use raw text)
-                    if "file:" in unprocessed_source.source_ref:
-                        file_id_str = unprocessed_source.source_ref.replace("file:", "")
-                        file_row = session.query(File).filter(File.id == int(file_id_str)).first()
-                        if not file_row:
-                            raise FileNotFoundError(f"Source {unprocessed_source.id} references missing file {file_id_str}.")
-                        input_data = file_row.stored_path
-                    else:
-                        # For 'paper:ID' or 'user_text_...', we use the pre-extracted raw_text
-                        input_data = unprocessed_source.raw_text or ""
+            try:
+                # 1. Adapter Layer: Physical Extraction / DLA
+                from app.ingestion.adapters.factory import get_adapter_for_source
+                adapter = get_adapter_for_source(unprocessed_source.source_type, unprocessed_source.source_ref)
+                
+                # Decide input for adapter (Resolve file path or use raw text)
+                if "file:" in unprocessed_source.source_ref:
+                    file_id_str = unprocessed_source.source_ref.replace("file:", "")
+                    file_row = session.query(File).filter(File.id == int(file_id_str)).first()
+                    if not file_row:
+                        raise FileNotFoundError(f"Source {unprocessed_source.id} references missing file {file_id_str}.")
+                    input_data = file_row.stored_path
+                else:
+                    # For 'paper:ID' or 'user_text_...', we use the pre-extracted raw_text
+                    input_data = unprocessed_source.raw_text or ""
 
+                future = prefetched.pop(unprocessed_source.id, None)
+                try:
+                    regions = future.result() if future is not None else None
+                except BrokenProcessPool:
+                    regions = None
+                if regions is None:
                     regions = adapter.extract_regions(input_data, admin_policy.algorithm.extraction)
-                    
-                    # 2. Refinery Layer: LLM Polishing (Conditional)
-                    refinery_config = admin_policy.algorithm.refinery
-                    should_refine = unprocessed_source.source_type in refinery_config.needs_refinement_types
-                    
-                    refined_parts = []
-                    if should_refine:
-                        from app.ingestion.refinery.service import TextRefineryService
-                        refinery = TextRefineryService()
-                        for reg in regions:
-                            word_count = len(reg.text.split())
-                            logger.info(f"IngestionService: Refining gathered {reg.region_type} region ({word_count} words).")
-                            logger.info(f"IngestionService: RAW CONTENT: {reg.text[:500]}...")
-                            
-                            clean_text = refinery.refine_text(reg.text)
-                            if clean_text:
-                                logger.info(f"IngestionService: CLEAN CONTENT: {clean_text[:500]}...")
-                                refined_parts.append(clean_text)
-                            else:
-                                logger.warning(f"IngestionService: Refinery rejected {reg.region_type} span (Noise?).")
-                    else:
-                        logger.info(f"IngestionService: Skipping refinement for clean source type: {unprocessed_source.source_type}.")
-                        refined_parts = [reg.text for reg in regions]
-                    
-                    full_text = "\n\n".join(refined_parts)
-
-                    # ENFORCE: Write extracted/refined text back to raw_text (canonical storage)
-                    # All adapters and extractors must populate this column before slicing
-                    unprocessed_source.raw_text = full_text
-                    session.add(unprocessed_source)
-                    logger.info(f"IngestionService: Stored extracted text ({len(full_text)} chars) to raw_text for source {unprocessed_source.id}")
-
-                    # 3. Slicing Layer: Sentence Integrity (reads from canonical raw_text)
-                    from app.ingestion.slicing.service import SentenceSlicingService
-                    slicer = SentenceSlicingService()
-                    blocks = slicer.slice_text(unprocessed_source.raw_text)
-
-                    # 4. Storage Layer: Persistence
-                    for idx, b_text in enumerate(blocks, 1):
-                        block = TextBlock(
-                            job_id=job_id,
-                            ingestion_source_id=unprocessed_source.id,
-                            block_text=b_text,
-                            block_order=idx,
-                            block_type="text_block",
-                            segmentation_strategy=admin_policy.algorithm.slicing.strategy,
-                            triples_extracted=False
-                        )
-                        session.add(block)
-                        blocks_created += 1
-
-                    unprocessed_source.processed = True
-                    session.add(unprocessed_source)
-                    session.commit()
-                    sources_processed += 1
-
-                except Exception as e:
-                    logger.error(f"IngestionService: Source {unprocessed_source.id} failed: {e}.", exc_info=True)
-                    session.rollback()
-                    continue
-
-            return {
-                "job_id": job_id,
-                "sources_processed": sources_processed,
-                "blocks_created": blocks_created
-            }
+                
+                # 2. Refinery Layer: LLM Polishing (Conditional)
+                refinery_config = admin_policy.algorithm.refinery
+                should_refine = unprocessed_source.source_type in refinery_config.needs_refinement_types
+                
+                refined_parts = []
+                if should_refine:
+                    from app.ingestion.refinery.service import TextRefineryService
+                    refinery = TextRefineryService()
+                    for reg in regions:
+                        word_count = len(reg.text.split())
+                        logger.info(f"IngestionService: Refining gathered {reg.region_type} region ({word_count} words).")
+                        logger.info(f"IngestionService: RAW CONTENT: {reg.text[:500]}...")
+                        
+                        clean_text = refinery.refine_text(reg.text)
+                        if clean_text:
+                            logger.info(f"IngestionService: CLEAN CONTENT: {clean_text[:500]}...")
+                            refined_parts.append(clean_text)
+                        else:
+                            logger.warning(f"IngestionService: Refinery rejected {reg.region_type} span (Noise?).")
+                else:
+                    logger.info(f"IngestionService: Skipping refinement for clean source type: {unprocessed_source.source_type}.")
+                    refined_parts = [reg.text for reg in regions]
+                
+                full_text = "\n\n".join(refined_parts)
+
+                # ENFORCE: Write extracted/refined text back to raw_text (canonical storage)
+                # All adapters and extractors must populate this column before slicing
+                unprocessed_source.raw_text = full_text
+                session.add(unprocessed_source)
+                logger.info(f"IngestionService: Stored extracted text ({len(full_text)} chars) to raw_text for source {unprocessed_source.id}")
+
+                # 3. Slicing Layer: Sentence Integrity (reads from canonical raw_text)
+                from app.ingestion.slicing.service import SentenceSlicingService
+                slicer = SentenceSlicingService()
+                blocks = slicer.slice_text(unprocessed_source.raw_text)
+
+                # 4. Storage Layer: Persistence
+                for idx, b_text in enumerate(blocks, 1):
+                    block = TextBlock(
+                        job_id=job_id,
+                        ingestion_source_id=unprocessed_source.id,
+                        block_text=b_text,
+                        block_order=idx,
+                        block_type="text_block",
+                        segmentation_strategy=admin_policy.algorithm.slicing.strategy,
+                        triples_extracted=False
+                    )
+                    session.add(block)
+                    blocks_created += 1
+
+                unprocessed_source.processed = True
+                session.add(unprocessed_source)
+                session.commit()
+                sources_processed += 1
+
+            except Exception as e:
+                logger.error(f"IngestionService: Source {unprocessed_source.id} failed: {e}.", exc_info=True)
+                session.rollback()
+                continue
+
+        return {
+            "job_id": job_id,
+            "sources_processed": sources_processed,
+            "blocks_created": blocks_created
+        }
 
     @staticmethod
     def get_blocks_for_job(job_id: int) -> list:
@@ -93,7 +93,7 @@ def persist_hypotheses(job_id: int, hypotheses: List[Dict], query_id: Optional[i
         Number of rows inserted.
     """
     from app.llm import get_llm_service
-    from app.domains.resolver import resolve_domain
+    from app.domains.resolver import resolve_domains
     from app.storage.models import Job
     
     if not hypotheses:
@@ -130,20 +130,25 @@ def persist_hypotheses(job_id: int, hypotheses: List[Dict], query_id: Optional[i
             key = (row.source, row.target, tuple(row.path or []))
             domain_cache[key] = row.domain
 
-        # 5. Deactivate current active set for these modes
+        # 5. Reuse domains where possible; resolve the rest in batched LLM calls
+        domains = [
+            h.get("domain") or domain_cache.get((h.get("source"), h.get("target"), tuple(h.get("path", []))))
+            for h in hypotheses
+        ]
+        missing = [i for i, domain in enumerate(domains) if not domain]
+        if missing:
+            resolved = resolve_domains([hypotheses[i] for i in missing], job_config, llm_client)
+            for i, domain in zip(missing, resolved):
+                domains[i] = domain
+
+        # 6. Deactivate current active set for these modes
         deactivate_hypotheses_for_job(job_id, modes=batch_modes)
 
-        # 6. Insert full snapshot
-        for h in hypotheses:
+        # 7. Insert full snapshot
+        for h, domain in zip(hypotheses, domains):
             source = h.get("source")
             target = h.get("target")
             path = h.get("path", [])
-            key = (source, target, tuple(path))
-            
-            # Reuse domain if possible
-            domain = h.get("domain") or domain_cache.get(key)
-            if not domain:
-                domain = resolve_domain(h, job_config, llm_client)
             
             # Identify affected nodes in this specific hypothesis
             path_nodes = set(path)
@@ -518,9 +523,9 @@ def group_top_hypotheses(
     
     for h in hypotheses:
         is_passed = h.get("passed_filter", False)
-        is_promising = is_low_confidence_rejection(h)
         
-        if not (is_passed or is_promising):
+        # Promising check only matters for rejected hypotheses
+        if not (is_passed or is_low_confidence_rejection(h)):
             continue
             
         src = h.get("source")
@@ -27,34 +27,16 @@ from scipy.spatial.distance import cosine
 from app.config.admin_policy import admin_policy
 from app.path_reasoning.filtering.logic import apply_hub_suppression_to_graph
 from app.embeddings.factory import get_embedding_provider
+from app.storage.redis_client import get_redis_sync
 
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
 # Synchronous Redis embedding cache
 # Cache key: emb:<text>  value: JSON list of floats
-# Reuses the same Redis URL as the rest of the app.
+# Uses the app-wide shared sync Redis client.
 # Falls back silently to re-embedding if Redis is unavailable.
 # ---------------------------------------------------------------------------
-_redis_sync = None
-
-def _get_redis_sync():
-    """Lazily create a sync Redis client (redis-py, not asyncio)."""
-    global _redis_sync
-    if _redis_sync is not None:
-        return _redis_sync
-    try:
-        import redis as _redis_lib
-        from app.config.system_settings import system_settings
-        _redis_sync = _redis_lib.from_url(system_settings.REDIS_URL, decode_responses=True)
-        _redis_sync.ping()  # Verify connection
-        logger.debug("Reasoning: sync Redis client connected for embedding cache")
-    except Exception as e:
-        logger.debug(f"Reasoning: Redis unavailable for embedding cache: {e}")
-        _redis_sync = None
-    return _redis_sync
-
-
 _EMBED_CACHE_PREFIX = "reasoning:emb:"
 _EMBED_CACHE_TTL = 7 * 24 * 3600  # 7 days
 
@@ -62,7 +44,7 @@ _EMBED_CACHE_TTL = 7 * 24 * 3600  # 7 days
 def _cached_embed(text: str) -> Optional[np.ndarray]:
     """Embed text, using Redis to avoid re-embedding the same string."""
     provider = get_embedding_provider()
-    r = _get_redis_sync()
+    r = get_redis_sync(decode_responses=True)
     key = f"{_EMBED_CACHE_PREFIX}{text}"
 
     # Try cache hit
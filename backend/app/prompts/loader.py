@@ -20,19 +20,25 @@ Contract:
 Invariants:
 - Always returns a string (never None, never raises)
 - Returns fallback if file missing or unreadable
-- No side effects
-- Stateless (safe to call repeatedly)
+- No side effects beyond a per-process cache of loaded templates
+- Safe to call repeatedly: each (filename, fallback) is read from disk once;
+  call load_prompt.cache_clear() to pick up edited prompt files
 """
 
 import os
 import logging
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
 def load_prompt(filename: str, fallback: str = "") -> str:
     """Load a prompt template file.
     
+    Results are memoized per (filename, fallback), so repeated loads by
+    re-instantiated services do not touch the filesystem.
+    
     Args:
         filename: Name of the prompt file (e.g., "triple_extraction.txt")
         fallback: Fallback template if file missing/unreadable (default empty string)
@@ -1,8 +1,21 @@
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import sessionmaker
 from app.config.system_settings import system_settings
 
 DATABASE_URL = system_settings.DATABASE_URL
 
-engine = create_engine(DATABASE_URL)
+# Pool sized for concurrent decision/worker sessions; pre_ping and recycle
+# avoid handing out connections the server has already dropped while idle.
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+)
 Base = declarative_base()
+
+# Session factory that keeps loaded attributes after commit, so post-commit
+# reads (logging, event payloads) do not trigger a refresh SELECT.
+SessionLocal = sessionmaker(bind=engine, expire_on_commit=False)
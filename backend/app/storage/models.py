@@ -1,10 +1,33 @@
-from sqlalchemy import Column, Integer, Text, String, Boolean, DateTime, ForeignKey, JSON, Enum, Float
+from sqlalchemy import Column, Integer, Text, String, Boolean, DateTime, ForeignKey, JSON, Enum, Float, LargeBinary, Index, func, literal_column
 from sqlalchemy.dialects.postgresql import JSONB
 from datetime import datetime
 from .db import Base
 import enum
 
 
+# Fingerprint bands with a functional index each (see Paper.__table_args__).
+# Fixed 2-byte slices: a digest of n bytes is fully covered by its first n // 2 bands.
+FINGERPRINT_BAND_WIDTH = 2
+FINGERPRINT_INDEXED_BANDS = 16
+
+
+def fingerprint_band(column, index: int):
+    """substr() expression for band `index` of a fingerprint column.
+    
+    Offsets are inlined as literals so queries render the exact expression
+    the band indexes were built on (bound parameters would not match them).
+    """
+    start = index * FINGERPRINT_BAND_WIDTH + 1
+    return func.substr(column, literal_column(str(start)), literal_column(str(FINGERPRINT_BAND_WIDTH)))
+
+
+def _fingerprint_band_indexes(column) -> tuple:
+    return tuple(
+        Index(f"ix_papers_fingerprint_band_{i}", fingerprint_band(column, i))
+        for i in range(FINGERPRINT_INDEXED_BANDS)
+    )
+
+
 # ============================================================================
 # Enumeration Types for Type Safety and Clarity
 # ============================================================================
@@ -136,13 +159,17 @@ class Paper(Base):
     year = Column(Integer, nullable=True)
     venue = Column(String, nullable=True)  # Conference, journal, etc.
     doi = Column(String, nullable=True, unique=True, index=True)
+    doi_norm = Column(String, nullable=True, unique=True, index=True)  # lower(trim(doi)) for exact dedup lookups
     external_ids = Column(JSON, nullable=True)  # e.g., {'arxiv_id': '2301.12345', 'pubmed_id': '12345678'}
-    fingerprint = Column(String, nullable=True, index=True)  # Content-based hash for deduplication
+    fingerprint = Column(LargeBinary, nullable=True, index=True)  # Raw content-hash digest for deduplication
     source = Column(String, nullable=False)  # 'arxiv', 'crossref', 'pubmed', etc.
     pdf_url = Column(String, nullable=True)
     
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
+    # Index-backed near-duplicate shortlisting (see deduplication.detector)
+    __table_args__ = _fingerprint_band_indexes(fingerprint)
+
 
 class File(Base):
     """
@@ -153,7 +180,7 @@ class File(Base):
     and may optionally reference the Paper from which it was downloaded.
     
     Future extensibility:
-    - Add file_size, checksum for integrity checking
+    - Add file_size for integrity checking
     - Add storage_location to distinguish between local, S3, etc.
     - Add deleted_at soft-delete timestamp for retention/compliance
     - Add extracted_text_available to optimize lazy-loading decisions
@@ -167,6 +194,7 @@ class File(Base):
     stored_path = Column(String, nullable=False)  # Full system path to the file
     original_filename = Column(String, nullable=False)
     file_type = Column(String, nullable=False)  # 'pdf', 'docx', 'txt', 'json', etc.
+    content_sha256 = Column(String(64), nullable=True, index=True)  # Hex digest; set for downloads, used for content dedup
     
     uploaded_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
@@ -466,6 +494,7 @@ class SearchQuery(Base):
     
     entities_used: Array of entities used to prepare this query for deduplication.
     entities_hash: Hash of entities for quick duplicate check. Different orderings ([a,c] vs [c,a]) are treated as different.
+    Unique per job, so verification inserts can skip duplicates with ON CONFLICT.
     
     Future extensibility:
     - Add query_type to distinguish between initial, expansion, or reuse attempts
@@ -473,6 +502,10 @@ class SearchQuery(Base):
     - Add domain_confidence to track resolution certainty
     """
     __tablename__ = "search_queries"
+    __table_args__ = (
+        # One query per entity combination per job; NULL hashes are not constrained
+        Index("uq_search_queries_job_id_entities_hash", "job_id", "entities_hash", unique=True),
+    )
 
     id = Column(Integer, primary_key=True)
     job_id = Column(Integer, ForeignKey("jobs.id"), nullable=False, index=True)
@@ -0,0 +1,40 @@
+"""
+Shared synchronous Redis clients (redis-py, not asyncio).
+
+Sync caches across the app (embedding cache, domain resolver, provider
+rate limits and response cache) reuse one lazily created client per
+decode mode instead of opening their own. Callers get None while Redis
+is unavailable and fall back to their uncached path.
+"""
+import logging
+
+logger = logging.getLogger(__name__)
+
+# decode_responses -> client
+_clients = {}
+
+
+def get_redis_sync(decode_responses: bool = False):
+    """
+    Return the shared sync Redis client, creating it on first use.
+    
+    Args:
+        decode_responses: True for str replies, False for raw bytes.
+    
+    Returns:
+        redis.Redis instance, or None if Redis is unavailable
+    """
+    client = _clients.get(decode_responses)
+    if client is not None:
+        return client
+    try:
+        import redis as _redis_lib
+        from app.config.system_settings import system_settings
+        client = _redis_lib.from_url(system_settings.REDIS_URL, decode_responses=decode_responses)
+        client.ping()  # Verify connection
+        logger.debug(f"Sync Redis client connected (decode_responses={decode_responses})")
+    except Exception as e:
+        logger.debug(f"Redis unavailable for sync client: {e}")
+        return None
+    _clients[decode_responses] = client
+    return client